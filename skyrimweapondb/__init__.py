@@ -0,0 +1,99 @@
+# Welcome to the Skyrim Weapon Database!
+# The purpose of this database is to store, insert, delete, and update
+# the weaponry from Skyrim (2011).
+# I started this project right around the time when I was bitten by
+# the Skyrim bug, adding hundreds of mods to the game and playing
+# for hours on end. It was a great source of inspiration for this
+# database. I kept everything as true to the gameplay as possible, with
+# minor exceptions for the sake of SQL simplicity.
+# SOME NOTES:
+#	- The data creation for materials is specified by types. This is intentional
+#	  as material uniquely defines the weight, damage, and value (and speed)
+#	  for each weapon type without any recognizeable pattern. Thus, material
+#	  must be created for each type, and (Name, Type) is its key.
+#	- Importing this package does not touch the database. The connection is
+#	  opened lazily by getConnection(), and the database is only created and
+#	  filled when build() or seed() is called.
+#	- The base game data is kept in one CSV file per table in the "seed"
+#	  directory, not in the code. "python3 -m skyrimweapondb import <dir>"
+#	  loads another directory of seed files, e.g. a mod's catalog.
+#	- The DLCs are packs (see packs.py): every row they add remembers the
+#	  pack it came from, so a pack can be unloaded again. Mods can be
+#	  loaded the same way with "python3 -m skyrimweapondb pack <dir>".
+#	- bestLoadouts() answers "what is the best weapon I can forge" questions
+#	  (see optimizer.py); "python3 -m skyrimweapondb loadout <level>".
+#	- exportSnapshot() writes the finished database to one file, which a
+#	  new worker can open with openSnapshot() instead of building it again.
+#	- buildSharded() builds a new database from many mod packs at once,
+#	  reading them in parallel processes (see shards.py).
+#	- WeaponCatalog holds the whole catalog in memory, indexed by ID, name,
+#	  material and type, for lookups without SQLite (see catalog.py).
+#	- Every change to the tables is recorded in ChangeLog, so copies of the
+#	  database can sync by applying only the changes (see changelog.py).
+#	- setProfiling(True), or the --profile flag, times every statement the
+#	  package runs; profiler.dump() prints the slowest ones.
+
+# HOW TO RUN:
+#	Simply open your command line shell, navigate to the directory that
+#	contains this package, and run "python3 -m skyrimweapondb" (or the old
+#	"python3 SQL.py").
+#	This will produce output within the shell as well as the creation of
+#	a new file, called SkyrimWeaponsDB.db
+#	The script can be run again on an existing database: the seed data is
+#	upserted, so only rows whose values changed are written.
+#	Run "python3 -m skyrimweapondb --help" for the other commands.
+
+import importlib
+
+# Importing the package only loads the connection, the query functions and
+# build(); every other name below is loaded from its module on first use.
+# build() and the profiler are loaded right away because their modules have
+# the same names: loading such a module later would hide the name.
+from .build import build, seed
+from .connection import closeConnection, getConnection, setDatabase, setProfiling
+from .profiler import ProfiledConnection, ProfiledCursor, QueryProfiler, profiler
+from .queries import (QUERIES, QUERY_EXAMPLES, printRows, runQuery, selectAllDwarvenAxes, selectBowsBySpeed,
+	selectDamageAbove, selectEnchantedWeapons, selectEnchantmentsForType, selectEnchantmentsForWarhammers,
+	selectForgeabilityPerkLevel, selectHighestDamage, selectIronWeapons, selectMaterialsBySpeed,
+	selectPerksAboveLevel, selectWeaponStatSheet, selectWeaponStats, selectWeaponsByMaterial, streamColumns,
+	streamQuery)
+
+# The names loaded on first use, by module
+LAZY_EXPORTS = {
+	"analytics": ("WeaponColumns", "printAnalytics"),
+	"cache": ("QueryCache", "queryCache"),
+	"catalog": ("CatalogWeapon", "WeaponCatalog"),
+	"changelog": ("DEFAULT_SOURCE", "LoggedChange", "applyChanges", "exportChanges", "latestSequence",
+		"pruneChanges", "readChangeFile", "syncPosition", "writeChangeFile"),
+	"deletions": ("applyDeletions", "deleteIronBow", "deleteSteelBow", "deleteWeapons"),
+	"importer": ("SEED_DIRECTORY", "importSeedFiles", "readSeedFile"),
+	"loader": ("bulkLoad", "createEnchantedWith", "createEnchanting", "createForgeability", "createMaterial",
+		"createType", "createWeapon", "syncTables"),
+	"optimizer": ("HANDEDNESS", "SCORES", "Loadout", "LoadoutOptimizer", "bestLoadouts", "printBestLoadouts"),
+	"packs": ("BUILTIN_PACKS", "PACK_DIRECTORY", "addDawngaurdDLC", "addDragonbornDLC", "listPacks", "loadPack",
+		"loadPackDirectory", "unloadPack"),
+	"patches": ("Change", "applyPatch", "readPatchFile"),
+	"pool": ("PRAGMAS", "ConnectionPool", "configureConnection"),
+	"replica": ("MemoryReplica",),
+	"schema": ("COLUMN_TYPES", "PACK_TABLES", "SEARCH_COLUMNS", "TABLE_COLUMNS", "TABLE_KEYS", "createTables",
+		"rebuildSearchIndexes", "rebuildWeaponStats"),
+	"search": ("printSearchResults", "searchEnchantments", "searchWeapons"),
+	"shards": ("buildSharded", "defaultSources", "mergeShards", "packSources"),
+	"snapshot": ("SNAPSHOT_APPLICATION_ID", "SNAPSHOT_VERSION", "exportSnapshot", "openSnapshot", "restoreSnapshot"),
+	"statements": ("DELETION_STATEMENTS", "INSERT_STATEMENTS", "STATEMENT_CACHE_SIZE", "UPSERT_STATEMENTS",
+		"insertSQL", "updateSQL", "upsertSQL"),
+	"updates": ("UNOFFICIAL_PATCH", "applyTitledPatch", "applyUnofficialPatch", "updateEbonyOneHandedAxe",
+		"updateEbonyOneHandedMace", "updateTwoHandedSwordSpeed"),
+}
+LAZY_MODULES = {name: module for module, names in LAZY_EXPORTS.items() for name in names}
+
+# Loads a name of LAZY_EXPORTS from its module, the first time it is asked for
+def __getattr__(name):
+	if name not in LAZY_MODULES:
+		raise AttributeError("module %r has no attribute %r" % (__name__, name))
+	value = getattr(importlib.import_module("." + LAZY_MODULES[name], __name__), name)
+	globals()[name] = value
+	return value
+
+def __dir__():
+	return sorted(set(globals()) | set(LAZY_MODULES))
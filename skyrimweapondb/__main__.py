@@ -0,0 +1,247 @@
+import argparse
+import logging
+import sqlite3
+import sys
+
+from . import connection
+from .analytics import printAnalytics
+from .build import build
+from .changelog import applyChanges, exportChanges, readChangeFile, syncPosition, writeChangeFile
+from .deletions import applyDeletions
+from .importer import importSeedFiles
+from .packs import listPacks, loadPackDirectory, unloadPack
+from .optimizer import printBestLoadouts
+from .patches import applyPatch, readPatchFile
+from .profiler import profiler
+from .queries import printQueryResults
+from .replica import MemoryReplica
+from .search import printSearchResults
+from .shards import buildSharded, defaultSources, packSources
+from .snapshot import exportSnapshot, restoreSnapshot
+from .schema import createTables
+from .updates import applyUnofficialPatch
+
+# COMMAND LINE
+# "python3 -m skyrimweapondb" builds the database and prints the updates,
+# deletions and query results, exactly like the original script did.
+# The other commands are:
+#	build                 only create and seed the database
+#	shardbuild <directory>  build a new database from the base game, the DLCs
+#	                      and every mod pack directory in <directory>, with
+#	                      one process per CPU
+#	queries               only print the query results
+#	benchmark [rows]      time bulkLoad against one commit per row
+#	concurrency [readers] time reader threads against a writer, WAL vs not
+#	audit [weapons]       fail if a query plan reads a whole table
+#	import <directory>    load a directory of seed files into the database
+#	pack <directory>      load (or reload) a DLC or mod pack
+#	unpack <name>         remove every row a pack added
+#	packs                 list the loaded packs
+#	packbench [weapons]   time loading, reloading and unloading packs
+#	suite [weapons]       run every benchmark on catalogs of 10^3 up to
+#	                      [weapons] (default 10^5) weapons, write the results
+#	                      to benchmark_results.json and fail on regressions
+#	                      (leaving the earlier results in the file)
+#	patch <file>          apply a JSON lines patch file in one transaction
+#	analytics             print aggregate stats per material tier and type
+#	analyticsbench [weapons]  time the analytics against SQLite's GROUP BY
+#	snapshot <file>       write the database to a snapshot file
+#	changes <file>        write the changes after --since N (default 0) to a
+#	                      change file
+#	sync <file>           apply a change file to this copy of the database
+#	restore <file>        replace the database with a snapshot
+#	replicabench [weapons]  time queries on the file against a MemoryReplica
+#	catalogbench [weapons]  compare a WeaponCatalog with lists of tuples
+#	shardbench [weapons]  time buildSharded against build and loading packs
+#	search <text>         autocomplete weapon names and search enchantments
+#	loadout [level]       print the best weapons by damage, DPS and value per
+#	                      weight that a player of [level] can forge
+# The read-only commands (queries, search, loadout and analytics) can be run
+# with --replica, which copies the database into memory first.
+# Any command can be run with --profile, which prints how long every SQL
+# statement took when it is done, and --slow-ms N, which logs every
+# statement slower than N milliseconds to stderr as it happens.
+
+# The commands whose argument is a path or name instead of a number
+TEXT_ARGUMENTS = {"import": "a seed directory", "pack": "a pack directory", "unpack": "a pack name",
+	"patch": "a patch file", "search": "some text to search for",
+	"snapshot": "a snapshot file", "restore": "a snapshot file", "shardbuild": "a directory of mod packs",
+	"changes": "a change file", "sync": "a change file"}
+# The commands that only read, and so can run on a MemoryReplica
+READ_COMMANDS = {"queries", "search", "loadout", "analytics"}
+
+def main(argv=None):
+	args = parseArguments(argv)
+	if args.profile or args.slowMs is not None:
+		connection.setProfiling(True)
+		if args.slowMs is not None:
+			profiler.slowThreshold = args.slowMs / 1000
+			logging.basicConfig(format="%(levelname)s %(name)s: %(message)s")
+	try:
+		return runCommand(args)
+	finally:
+		if args.profile:
+			connection.closeConnection()
+			print()
+			print("PROFILE")
+			profiler.dump()
+
+# Parses the command line. The numeric argument, if any, ends up in
+# args.sizeArgs.
+def parseArguments(argv):
+	parser = argparse.ArgumentParser(prog="skyrimweapondb", description="The Skyrim Weapon Database")
+	parser.add_argument("--database", default=connection.DATABASE, help="database file (default: %(default)s)")
+	parser.add_argument("--replica", action="store_true",
+		help="run read-only commands on an in-memory copy of the database")
+	parser.add_argument("--profile", action="store_true", help="print the time taken by every SQL statement")
+	parser.add_argument("--slow-ms", dest="slowMs", type=float, metavar="N",
+		help="log every SQL statement slower than N milliseconds")
+	parser.add_argument("--since", type=int, default=0, metavar="N",
+		help="the last change the copy already has, for changes")
+	parser.add_argument("command", nargs="?", default="run", choices=["run", "build", "queries", "benchmark", "concurrency", "audit", "import", "pack", "unpack", "packs", "packbench", "patch", "suite", "loadout", "analytics", "analyticsbench", "search", "snapshot", "restore", "replicabench", "catalogbench", "shardbuild", "shardbench", "changes", "sync"])
+	parser.add_argument("argument", nargs="?",
+		help="row count for benchmark, audit, packbench, analyticsbench, replicabench, catalogbench, shardbench and suite, thread count for concurrency, smithing level for loadout, "
+		"seed directory for import and pack, mod directory for shardbuild, pack name for unpack, patch file for patch, text for search, snapshot file for snapshot and restore, change file for changes and sync")
+	args = parser.parse_args(argv)
+	sizeArgs = []
+	if args.command in TEXT_ARGUMENTS:
+		if args.argument is None:
+			parser.error("%s needs %s" % (args.command, TEXT_ARGUMENTS[args.command]))
+	elif args.argument is not None:
+		try:
+			sizeArgs = [int(args.argument)]
+		except ValueError:
+			parser.error("%s needs a whole number, not %r" % (args.command, args.argument))
+	args.sizeArgs = sizeArgs
+	return args
+
+# Runs one command on the parsed arguments and returns the exit status
+def runCommand(args):
+	sizeArgs = args.sizeArgs
+	if args.command == "benchmark":
+		from .benchmark import benchmarkBulkLoad
+		benchmarkBulkLoad(*sizeArgs)
+		return 0
+	if args.command == "concurrency":
+		from .benchmark import benchmarkConcurrency
+		benchmarkConcurrency(*sizeArgs)
+		return 0
+	if args.command == "audit":
+		from .audit import runQueryPlanAudit
+		return 1 if runQueryPlanAudit(*sizeArgs) else 0
+	if args.command == "suite":
+		from .benchmark import runBenchmarkSuite
+		results, regressions = runBenchmarkSuite(*sizeArgs)
+		return 1 if regressions else 0
+	if args.command == "analyticsbench":
+		from .benchmark import benchmarkAnalytics
+		benchmarkAnalytics(*sizeArgs)
+		return 0
+	if args.command == "catalogbench":
+		from .benchmark import benchmarkWeaponCatalog
+		benchmarkWeaponCatalog(*sizeArgs)
+		return 0
+	if args.command == "replicabench":
+		from .benchmark import benchmarkReplica
+		benchmarkReplica(*sizeArgs)
+		return 0
+	if args.command == "shardbench":
+		from .benchmark import benchmarkShardedBuild
+		benchmarkShardedBuild(*sizeArgs)
+		return 0
+	if args.command == "packbench":
+		from .benchmark import benchmarkPacks
+		benchmarkPacks(*sizeArgs)
+		return 0
+
+	connection.setDatabase(args.database)
+	if args.replica and args.command in READ_COMMANDS:
+		connect = MemoryReplica(args.database).reader()
+	else:
+		connect = connection.getConnection()
+	if args.command in ("run", "build"):
+		build(connect)
+	if args.command == "shardbuild":
+		try:
+			counts = buildSharded(connect, defaultSources() + packSources(args.argument))
+		except (OSError, ValueError) as error:
+			print("build failed, nothing was written: %s" % error, file=sys.stderr)
+			return 1
+		for table, count in counts.items():
+			print("%s: %d rows written" % (table, count))
+	if args.command == "import":
+		createTables(connect)
+		try:
+			counts = importSeedFiles(connect, args.argument)
+		except ValueError as error:
+			print("import failed, nothing was written: %s" % error, file=sys.stderr)
+			return 1
+		for table, count in counts.items():
+			print("%s: %d rows written" % (table, count))
+	if args.command == "pack":
+		createTables(connect)
+		try:
+			counts = loadPackDirectory(connect, args.argument)
+		except ValueError as error:
+			print("pack failed to load, nothing was written: %s" % error, file=sys.stderr)
+			return 1
+		for table, count in counts.items():
+			print("%s: %d rows written" % (table, count))
+	if args.command == "patch":
+		try:
+			diff = applyPatch(connect, readPatchFile(args.argument))
+		except ValueError as error:
+			print("patch failed, nothing was written: %s" % error, file=sys.stderr)
+			return 1
+		for change, before, after in diff:
+			if before != after:
+				print("%s\n -> %s" % (before, after))
+		print("%d changes applied" % len(diff))
+	if args.command == "unpack":
+		try:
+			counts = unloadPack(connect, args.argument)
+		except sqlite3.IntegrityError as error:
+			print("unpack failed, nothing was removed: %s" % error, file=sys.stderr)
+			return 1
+		for table, count in counts.items():
+			print("%s: %d rows removed" % (table, count))
+	if args.command == "packs":
+		for pack, counts in listPacks(connect).items():
+			print("%s: %s" % (pack, ", ".join("%d %s rows" % (count, table) for table, count in counts.items())))
+	if args.command == "snapshot":
+		print("%d bytes written to %s" % (exportSnapshot(connect, args.argument), args.argument))
+	if args.command == "restore":
+		try:
+			restoreSnapshot(connect, args.argument)
+		except ValueError as error:
+			print("restore failed, nothing was written: %s" % error, file=sys.stderr)
+			return 1
+	if args.command == "changes":
+		try:
+			count = writeChangeFile(args.argument, exportChanges(connect, args.since))
+		except ValueError as error:
+			print("no changes written: %s" % error, file=sys.stderr)
+			return 1
+		print("%d changes written to %s" % (count, args.argument))
+	if args.command == "sync":
+		try:
+			count = applyChanges(connect, readChangeFile(args.argument))
+		except ValueError as error:
+			print("sync failed, nothing was written: %s" % error, file=sys.stderr)
+			return 1
+		print("%d changes applied, now at change %d" % (count, syncPosition(connect)))
+	if args.command == "search":
+		printSearchResults(connect, args.argument)
+	if args.command == "analytics":
+		printAnalytics(connect)
+	if args.command == "loadout":
+		printBestLoadouts(connect, *sizeArgs)
+	if args.command == "run":
+		applyUnofficialPatch(connect)
+		applyDeletions(connect)
+	if args.command in ("run", "queries"):
+		printQueryResults(connect)
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
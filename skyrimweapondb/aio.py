@@ -0,0 +1,119 @@
+import asyncio
+import concurrent.futures
+import threading
+
+from .pool import ConnectionPool
+from .queries import runQuery
+
+# ASYNCIO QUERIES
+# The query functions block, so calling them from an asyncio service stalls
+# the event loop. AsyncQueries runs them on a small thread pool instead, each
+# worker thread reading through its own pooled connection (and the shared
+# read cache), and returns the rows instead of printing them.
+#	async with AsyncQueries() as queries:
+#		rows = await queries.selectIronWeapons()
+# Backpressure: at most "maxPending" queries are queued or running at once;
+# further callers wait for a free slot instead of piling up in the executor.
+# A query holds its slot until its worker thread is done with it, even if
+# its caller was cancelled.
+# Cancellation: cancelling a caller drops its query if it has not started
+# yet, or interrupts the running SQLite statement if it has.
+# This module imports asyncio, so it is not imported by the package itself.
+class AsyncQueries:
+	def __init__(self, pool=None, maxWorkers=4, maxPending=64):
+		self.ownsPool = pool is None
+		self.pool = pool or ConnectionPool()
+		self.executor = concurrent.futures.ThreadPoolExecutor(maxWorkers, thread_name_prefix="skyrimweapondb")
+		self.maxPending = maxPending
+		self.slots = None
+		# The connection each running query reads through, by query token.
+		# The lock keeps a cancelled caller from interrupting the connection
+		# once its worker has moved on to another caller's query.
+		self.running = {}
+		self.runningLock = threading.Lock()
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, *exception):
+		await self.aclose()
+
+	# Runs one of the registered QUERIES and returns its rows
+	async def query(self, name, params=()):
+		# Created here so it belongs to the running event loop
+		if self.slots is None:
+			self.slots = asyncio.Semaphore(self.maxPending)
+		await self.slots.acquire()
+		loop = asyncio.get_running_loop()
+		token = object()
+
+		def work():
+			connect = self.pool.reader()
+			with self.runningLock:
+				self.running[token] = connect
+			try:
+				return runQuery(connect, name, params)
+			finally:
+				with self.runningLock:
+					del self.running[token]
+
+		try:
+			future = self.executor.submit(work)
+		except BaseException:
+			self.slots.release()
+			raise
+		# Released when the worker is done, not when the caller gives up
+		future.add_done_callback(lambda future: loop.call_soon_threadsafe(self.slots.release))
+		try:
+			return await asyncio.wrap_future(future)
+		except asyncio.CancelledError:
+			with self.runningLock:
+				connect = self.running.get(token)
+				if connect is not None:
+					connect.interrupt()
+			raise
+
+	# Stops the worker threads, after letting the queries in them finish,
+	# without blocking the event loop while they do
+	async def aclose(self):
+		await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+	# Stops the worker threads, after letting the queries in them finish.
+	# Blocks until they do: from a coroutine, await aclose() instead.
+	def close(self):
+		self.executor.shutdown(wait=True)
+		if self.ownsPool:
+			self.pool.close()
+
+	async def selectIronWeapons(self):
+		return await self.query("weaponsByMaterial", ("Iron",))
+
+	async def selectBowsBySpeed(self):
+		return await self.query("materialsBySpeed", (0.75,))
+
+	async def selectEnchantedWeapons(self):
+		return await self.query("enchantedWeapons")
+
+	async def selectForgeabilityPerkLevel(self):
+		return await self.query("perksAboveLevel", (20,))
+
+	# Both dwarven axe queries run at the same time
+	async def selectAllDwarvenAxes(self):
+		oneHanded, twoHanded = await asyncio.gather(
+			self.query("weaponsByMaterialAndType", ("Dwarven", "One-Handed Axe")),
+			self.query("weaponsByMaterialAndType", ("Dwarven", "Two-Handed Axe")))
+		return oneHanded + twoHanded
+
+	async def selectEnchantmentsForWarhammers(self):
+		return await self.query("enchantmentsForType", ("Two-Handed Mace",))
+
+	async def selectHighestDamage(self):
+		return await self.query("damageAbove", (13,))
+
+	async def selectWeaponStats(self, weaponID):
+		rows = await self.query("weaponStats", (weaponID,))
+		return rows[0] if rows else None
+
+	async def selectWeaponStatSheet(self, weaponID):
+		rows = await self.query("weaponStatSheet", (weaponID,))
+		return rows[0] if rows else None
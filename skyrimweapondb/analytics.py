@@ -0,0 +1,162 @@
+# ANALYTICS
+# Aggregate questions ("mean damage per material", "how does value grow
+# from Iron to Daedric", "how is DPS spread within each type") are answered
+# from columns instead of rows. WeaponColumns reads every weapon's stats
+# ONCE, a batch of rows at a time, into one typed array per column
+# (array.array, 8 bytes a value instead of a Python object per cell), and
+# stores the text columns as integer codes into a list of labels.
+# A grouped aggregation then sorts the row positions by group code once
+# and gathers each column in that order, so every group is a contiguous
+# slice: its count, sum, min and max are taken by the builtins in C, and
+# its percentiles come straight from the sorted slice, without a Python
+# loop over the rows.
+import array
+import collections
+import math
+
+# The columns read for every weapon. DPS is damage times the type's swing
+# speed, or the material's draw speed for bows, which have no type speed.
+# Weapons without a material row have no stats and are left out.
+COLUMNS_SQL = '''SELECT Type, Material, Weight, Damage, Value,
+	Damage * COALESCE(TypeSpeed, MaterialSpeed, 1.0), COALESCE(ForgeLevel, 0)
+	FROM WeaponStats WHERE Damage IS NOT NULL'''
+TEXT_COLUMNS = ("Type", "Material")
+NUMBER_COLUMNS = ("Weight", "Damage", "Value", "DPS", "ForgeLevel")
+
+AGGREGATES = ("count", "sum", "mean", "min", "max")
+
+class WeaponColumns:
+	def __init__(self, connect, arraysize=4096):
+		self.numbers = {column: array.array("d") for column in NUMBER_COLUMNS}
+		# codes[column][row] is the position of the row's value in labels[column]
+		self.codes = {column: array.array("l") for column in TEXT_COLUMNS}
+		self.labels = {column: [] for column in TEXT_COLUMNS}
+		# The (order, groups) of every column grouped by so far
+		self.groupings = {}
+		positions = {column: {} for column in TEXT_COLUMNS}
+		cursor = connect.cursor()
+		cursor.arraysize = arraysize
+		try:
+			cursor.execute(COLUMNS_SQL)
+			rows = cursor.fetchmany()
+			while rows:
+				batch = list(zip(*rows))
+				for column, values in zip(TEXT_COLUMNS, batch):
+					codes = positions[column]
+					labels = self.labels[column]
+					for value in set(values) - codes.keys():
+						codes[value] = len(labels)
+						labels.append(value)
+					self.codes[column].extend(map(codes.__getitem__, values))
+				for column, values in zip(NUMBER_COLUMNS, batch[len(TEXT_COLUMNS):]):
+					self.numbers[column].extend(values)
+				rows = cursor.fetchmany()
+		finally:
+			cursor.close()
+
+	def __len__(self):
+		return len(self.numbers["Damage"])
+
+	# Returns (order, groups) for a text column: the row positions sorted by
+	# their value of "key", and (label, start, end) for each group's slice
+	# of that order, in label order
+	def grouping(self, key):
+		if key not in self.codes:
+			raise ValueError("can only group by %s, not %r" % (", ".join(TEXT_COLUMNS), key))
+		if key not in self.groupings:
+			codes = self.codes[key]
+			labels = self.labels[key]
+			counts = collections.Counter(codes)
+			order = array.array("l", sorted(range(len(codes)), key=codes.__getitem__))
+			# The rows are sorted by code, so the groups' slices follow
+			# each other in code order
+			offsets = {}
+			start = 0
+			for code in sorted(counts):
+				offsets[code] = start
+				start += counts[code]
+			groups = sorted(((labels[code], offsets[code], offsets[code] + counts[code]) for code in counts),
+				key=lambda group: group[0])
+			self.groupings[key] = (order, groups)
+		return self.groupings[key]
+
+	# Returns a number column gathered in a grouping's order
+	def gather(self, column, order):
+		if column not in self.numbers:
+			raise ValueError("can only aggregate %s, not %r" % (", ".join(NUMBER_COLUMNS), column))
+		return array.array("d", map(self.numbers[column].__getitem__, order))
+
+	# Returns {group: {aggregate: value}} for a number column grouped by a
+	# text column, e.g. groupBy("Material", "Damage")
+	def groupBy(self, key, column, aggregates=AGGREGATES):
+		order, groups = self.grouping(key)
+		values = self.gather(column, order)
+		results = {}
+		for label, start, end in groups:
+			part = values[start:end]
+			total = math.fsum(part)
+			stats = {"count": end - start, "sum": total, "mean": total / (end - start),
+				"min": min(part), "max": max(part)}
+			results[label] = {aggregate: stats[aggregate] for aggregate in aggregates}
+		return results
+
+	# Returns {group: [percentile, ...]} for a number column grouped by a
+	# text column, with the percentiles (0 to 100) linearly interpolated
+	# between the closest ranks
+	def percentiles(self, key, column, percents=(10, 50, 90)):
+		order, groups = self.grouping(key)
+		values = self.gather(column, order)
+		results = {}
+		for label, start, end in groups:
+			part = sorted(values[start:end])
+			results[label] = [interpolate(part, percent) for percent in percents]
+		return results
+
+	# Returns the rank of every row by a number column, 1 for the highest
+	# (or lowest, with descending=False); equal values share a rank
+	def rank(self, column, descending=True):
+		values = self.numbers[column]
+		order = sorted(range(len(values)), key=values.__getitem__, reverse=descending)
+		ranks = array.array("l", bytes(array.array("l").itemsize * len(values)))
+		rank = 0
+		previous = None
+		for position, row in enumerate(order, 1):
+			if values[row] != previous:
+				rank = position
+				previous = values[row]
+			ranks[row] = rank
+		return ranks
+
+	# Returns the materials from the lowest smithing tier to the highest
+	# (Iron ... Daedric), each with the mean of a number column, i.e. how
+	# that column grows across the tiers
+	def tierCurve(self, column="Value"):
+		tiers = self.groupBy("Material", "ForgeLevel", ("min",))
+		means = self.groupBy("Material", column, ("mean",))
+		return [(material, tiers[material]["min"], means[material]["mean"])
+			for material in sorted(means, key=lambda material: (tiers[material]["min"], material))]
+
+# Returns a percentile of a sorted list of numbers
+def interpolate(values, percent):
+	if not values:
+		return None
+	position = (len(values) - 1) * percent / 100
+	low = math.floor(position)
+	high = min(low + 1, len(values) - 1)
+	return values[low] + (values[high] - values[low]) * (position - low)
+
+# Prints the mean damage per material tier, the value curve across the
+# tiers and the DPS distribution of every weapon type
+def printAnalytics(connect):
+	columns = WeaponColumns(connect)
+	print("WEAPON ANALYTICS (%d weapons)" % len(columns))
+	print("Mean Damage And Value By Material Tier:")
+	damage = columns.groupBy("Material", "Damage")
+	for material, level, value in columns.tierCurve("Value"):
+		print("%-12s level %3d  %3d weapons  damage %5.1f (%g-%g)  value %7.1f" % (material, level,
+			damage[material]["count"], damage[material]["mean"], damage[material]["min"], damage[material]["max"], value))
+	print()
+	print("DPS Percentiles (10th, 50th, 90th) By Type:")
+	for type, (low, median, high) in columns.percentiles("Type", "DPS").items():
+		print("%-18s %6.2f %6.2f %6.2f" % (type, low, median, high))
+	print()
@@ -0,0 +1,34 @@
+# QUERY PLAN AUDIT
+import sqlite3
+
+from .benchmark import syntheticTables
+from .loader import bulkLoad
+from .queries import FULL_SCAN_QUERIES, QUERIES, QUERY_EXAMPLES
+from .schema import createTables
+
+# Runs EXPLAIN QUERY PLAN for every registered query and returns the plan
+# steps of each one that reads a full table ("SCAN") instead of searching
+# an index, i.e. {query name: [plan details]}. An empty result means passing.
+def auditQueryPlans(connect):
+	failures = {}
+	cursor = connect.cursor()
+	for name, SQL in QUERIES.items():
+		cursor.execute("EXPLAIN QUERY PLAN " + SQL, QUERY_EXAMPLES[name])
+		details = [row[3] for row in cursor.fetchall()]
+		print("%s: %s" % (name, "; ".join(details)))
+		if name not in FULL_SCAN_QUERIES and any(detail.startswith("SCAN") for detail in details):
+			failures[name] = details
+	return failures
+
+# Fills an in-memory database with a large synthetic catalog and audits the
+# query plans against it. Run with "python3 -m skyrimweapondb audit [weapons]".
+def runQueryPlanAudit(weaponCount=100000):
+	auditConnect = sqlite3.connect(":memory:")
+	createTables(auditConnect)
+	bulkLoad(auditConnect, syntheticTables(weaponCount))
+	print("QUERY PLAN AUDIT (%d weapons)" % weaponCount)
+	failures = auditQueryPlans(auditConnect)
+	auditConnect.close()
+	for name in failures:
+		print("FAILED: %s reads a whole table" % name)
+	return failures
@@ -0,0 +1,592 @@
+import csv
+import json
+import os
+import platform
+import random as randomModule
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+try:
+	import resource
+except ImportError:
+	resource = None
+
+from .analytics import WeaponColumns
+from .build import build, seed
+from .cache import queryCache
+from .catalog import WeaponCatalog
+from .changelog import applyChanges, exportChanges, readChangeFile, syncPosition, writeChangeFile
+from .deletions import deleteWeapons
+from .importer import SEED_DIRECTORY, readSeedFile
+from .loader import bulkLoad, createWeapon
+from .optimizer import SCORES, LoadoutOptimizer
+from .packs import BUILTIN_PACKS, PACK_DIRECTORY, loadPack, loadPackDirectory, unloadPack
+from .patches import Change, applyPatch
+from .pool import PRAGMAS, ConnectionPool
+from .queries import (QUERIES, QUERY_EXAMPLES, selectAllDwarvenAxes, selectBowsBySpeed, selectEnchantedWeapons,
+	selectEnchantmentsForWarhammers, selectForgeabilityPerkLevel, selectHighestDamage, selectIronWeapons,
+	selectWeaponStatSheet, selectWeaponStats)
+from .replica import MemoryReplica
+from .schema import TABLE_COLUMNS, createTables
+from .search import searchEnchantments, searchWeapons
+from .shards import buildSharded, defaultSources, packSources
+from .snapshot import exportSnapshot, openSnapshot, restoreSnapshot
+
+# BENCHMARK
+# Compares the old one-row-per-commit path (createWeapon) against bulkLoad by
+# writing the same synthetic weapons into two freshly seeded database files
+# (the weapons need the seeded types and materials for their foreign keys).
+# Run with "python3 -m skyrimweapondb benchmark [rows]".
+def benchmarkBulkLoad(rowCount=5000, chunkSize=1000):
+	weapons = [("b%07x" % i, "Weapon %d" % i, "One-Handed Sword", "Iron") for i in range(rowCount)]
+	directory = tempfile.mkdtemp()
+	try:
+		perRow = sqlite3.connect(os.path.join(directory, "perrow.db"))
+		createTables(perRow)
+		seed(perRow)
+		start = time.perf_counter()
+		for weapon in weapons:
+			createWeapon(perRow, weapon)
+		perRowTime = time.perf_counter() - start
+		perRow.close()
+
+		bulk = sqlite3.connect(os.path.join(directory, "bulk.db"))
+		createTables(bulk)
+		seed(bulk)
+		start = time.perf_counter()
+		bulkLoad(bulk, {"Weapon": weapons}, chunkSize)
+		bulkTime = time.perf_counter() - start
+		bulk.close()
+	finally:
+		shutil.rmtree(directory)
+
+	print("BULK LOAD BENCHMARK (%d weapons)" % rowCount)
+	print("Per-row createWeapon: %.3fs, %d rows/sec" % (perRowTime, rowCount / perRowTime))
+	print("bulkLoad:             %.3fs, %d rows/sec" % (bulkTime, rowCount / bulkTime))
+	print("Speedup:              %.1fx" % (perRowTime / bulkTime))
+	return perRowTime, bulkTime
+
+# SYNTHETIC DATA
+# The base game's weapon types and materials. The synthetic catalog uses
+# them as its first names, so the select* queries, which look for e.g.
+# Iron weapons or Dwarven axes, find rows in it.
+SYNTHETIC_TYPES = ("One-Handed Sword", "One-Handed Axe", "One-Handed Mace", "One-Handed Dagger",
+	"Two-Handed Sword", "Two-Handed Axe", "Two-Handed Mace", "Bow")
+SYNTHETIC_MATERIALS = ("Iron", "Steel", "Orcish", "Dwarven", "Elven", "Glass", "Ebony", "Daedric")
+
+# Generates a made-up catalog with "weaponCount" weapons, shaped like the
+# real data (every material exists for every type), in the format bulkLoad
+# takes. Used to see how the schema behaves at modded-game sizes.
+def syntheticTables(weaponCount, seed=0):
+	random = randomModule.Random(seed)
+	typeCount = len(SYNTHETIC_TYPES)
+	materialCount = max(len(SYNTHETIC_MATERIALS), weaponCount // 100)
+	typeNames = list(SYNTHETIC_TYPES)
+	materialNames = list(SYNTHETIC_MATERIALS) + ["Material %d" % i for i in range(len(SYNTHETIC_MATERIALS), materialCount)]
+	enchantmentNames = ["Enchantment %d" % i for i in range(typeCount * 10)]
+	return {
+		"Type": [(name, round(random.uniform(0.5, 1.3), 2), round(random.uniform(0, 1.3), 2), 1) for name in typeNames],
+		"Forgeability": [(random.randint(1, 100), "Perk %d" % i) for i in range(materialCount)],
+		"Material": ((name, typeName, random.randint(1, 35), random.randint(1, 30), random.randint(10, 5000),
+			round(random.uniform(0.5, 1), 4) if typeName == typeNames[-1] else None, "Perk %d" % i)
+			for i, name in enumerate(materialNames) for typeName in typeNames),
+		"Weapon": (("%08x" % i, "Weapon %d" % i, random.choice(typeNames), random.choice(materialNames))
+			for i in range(weaponCount)),
+		"Enchanting": [(name, "Effect of %s" % name, typeNames[i % typeCount]) for i, name in enumerate(enchantmentNames)],
+		"EnchantedWith": (("%08x" % i, random.choice(enchantmentNames)) for i in range(0, weaponCount, 10)),
+	}
+
+# ANALYTICS BENCHMARK
+# Times the same aggregations with WeaponColumns (see analytics.py) and
+# with SQLite's GROUP BY over a synthetic catalog of "weaponCount" weapons:
+# count, sum, mean, min and max of damage per material, and of DPS per type.
+# Run with "python3 -m skyrimweapondb analyticsbench [weapons]".
+ANALYTICS_GROUP_BY = '''SELECT {key}, COUNT(*), SUM({column}), AVG({column}), MIN({column}), MAX({column})
+	FROM (SELECT Type, Material, Damage, Damage * COALESCE(TypeSpeed, MaterialSpeed, 1.0) AS DPS
+		FROM WeaponStats WHERE Damage IS NOT NULL)
+	GROUP BY {key}'''
+
+def benchmarkAnalytics(weaponCount=100000, repeat=5):
+	connect = sqlite3.connect(":memory:")
+	createTables(connect)
+	bulkLoad(connect, syntheticTables(weaponCount))
+	start = time.perf_counter()
+	columns = WeaponColumns(connect)
+	loadSeconds = time.perf_counter() - start
+	print("ANALYTICS BENCHMARK (%d weapons, columns loaded in %.3fs)" % (weaponCount, loadSeconds))
+	results = {"load": loadSeconds}
+	for key, column in (("Material", "Damage"), ("Type", "DPS")):
+		SQL = ANALYTICS_GROUP_BY.format(key=key, column=column)
+		sqlSeconds = min(timed(lambda: connect.execute(SQL).fetchall()) for _ in range(repeat))
+		# The first call also sorts the rows into groups, which later calls reuse
+		firstSeconds = timed(lambda: columns.groupBy(key, column))
+		columnSeconds = min(timed(lambda: columns.groupBy(key, column)) for _ in range(repeat))
+		groups = columns.groupBy(key, column)
+		for row in connect.execute(SQL):
+			if abs(groups[row[0]]["mean"] - row[3]) > 1e-9:
+				raise AssertionError("%s %s: mean %r, GROUP BY says %r" % (key, row[0], groups[row[0]]["mean"], row[3]))
+		print("%s by %s: GROUP BY %.4fs  columns %.4fs (first call %.4fs)  %.1fx" % (
+			column, key, sqlSeconds, columnSeconds, firstSeconds, sqlSeconds / columnSeconds))
+		results["%s.%s" % (key, column)] = {"groupBy": sqlSeconds, "columns": columnSeconds, "first": firstSeconds}
+	connect.close()
+	return results
+
+# Returns how many seconds one call of function() takes
+def timed(function):
+	start = time.perf_counter()
+	function()
+	return time.perf_counter() - start
+
+# Returns how many seconds the fastest of "runs" calls of function() takes
+def fastest(function, runs=5):
+	return min(timed(function) for _ in range(runs))
+
+# CATALOG BENCHMARK
+# Compares a WeaponCatalog (see catalog.py) of "weaponCount" synthetic
+# weapons with the same weapons held as a list of WeaponStats tuples and a
+# dictionary of them by ID: the memory each takes (measured with
+# tracemalloc), and the time of a lookup by ID and of a lookup of every
+# weapon of one material and type, against the same lookups in SQLite
+# (fastest of 5 runs).
+# Run with "python3 -m skyrimweapondb catalogbench [weapons]".
+CATALOG_STATS = '''SELECT ID, Name, Type, Material, TypeSpeed, Stagger, Reach, Weight, Damage, Value,
+	MaterialSpeed, Forgeability, ForgeLevel FROM WeaponStats'''
+def benchmarkWeaponCatalog(weaponCount=100000, repeat=1000):
+	connect = sqlite3.connect(":memory:")
+	createTables(connect)
+	bulkLoad(connect, syntheticTables(weaponCount))
+	tracemalloc.start()
+	try:
+		start = tracemalloc.get_traced_memory()[0]
+		catalog = WeaponCatalog(connect)
+		catalogBytes = tracemalloc.get_traced_memory()[0] - start
+		start = tracemalloc.get_traced_memory()[0]
+		rows = connect.execute(CATALOG_STATS).fetchall()
+		byID = {row[0]: row for row in rows}
+		rowBytes = tracemalloc.get_traced_memory()[0] - start
+	finally:
+		tracemalloc.stop()
+	random = randomModule.Random(0)
+	IDs = [random.choice(catalog.ids) for _ in range(repeat)]
+	material, type = SYNTHETIC_MATERIALS[3], SYNTHETIC_TYPES[1]
+	results = {"catalogBytes": catalogBytes, "rowBytes": rowBytes}
+	results["getCatalog"] = fastest(lambda: [catalog.get(ID) for ID in IDs]) / repeat
+	results["getRows"] = fastest(lambda: [byID[ID] for ID in IDs]) / repeat
+	results["getSQLite"] = fastest(lambda: [connect.execute(CATALOG_STATS + " WHERE ID = ?", (ID,)).fetchone()
+		for ID in IDs]) / repeat
+	results["findCatalog"] = fastest(lambda: catalog.find(material, type))
+	results["findSQLite"] = fastest(lambda: connect.execute(CATALOG_STATS
+		+ " WHERE ID IN (SELECT ID FROM Weapon WHERE Material = ? AND Type = ?)", (material, type)).fetchall())
+	connect.close()
+	print("CATALOG BENCHMARK (%d weapons)" % weaponCount)
+	print("Memory: catalog %.1f MiB, WeaponStats tuples %.1f MiB (%.1fx smaller)" % (catalogBytes / 2**20,
+		rowBytes / 2**20, rowBytes / catalogBytes))
+	print("Lookup by ID: catalog %.2fus, dict of tuples %.2fus, SQLite %.2fus" % (results["getCatalog"] * 1e6,
+		results["getRows"] * 1e6, results["getSQLite"] * 1e6))
+	print("%s %s weapons (%d): catalog %.3fms, SQLite %.3fms" % (material, type, len(catalog.find(material, type)),
+		results["findCatalog"] * 1e3, results["findSQLite"] * 1e3))
+	return results
+
+# REPLICA BENCHMARK
+# Compares the latency of every registered query on a pooled connection to
+# a database file of "weaponCount" synthetic weapons (WAL, memory-mapped)
+# against a MemoryReplica of the same file, bypassing the read cache, and
+# times making a fresh copy after a write.
+# Run with "python3 -m skyrimweapondb replicabench [weapons]".
+def benchmarkReplica(weaponCount=100000, repeat=1000):
+	directory = tempfile.mkdtemp()
+	try:
+		path = os.path.join(directory, "replica.db")
+		connect = sqlite3.connect(path)
+		createTables(connect)
+		bulkLoad(connect, syntheticTables(weaponCount))
+		connect.close()
+		pool = ConnectionPool(path)
+		pool.reader()
+		start = time.perf_counter()
+		replica = MemoryReplica(path)
+		copySeconds = time.perf_counter() - start
+		print("REPLICA BENCHMARK (%d weapons, copied in %.3fs, mean of %d runs)" % (weaponCount, copySeconds, repeat))
+		results = {"copy": copySeconds}
+		for name, SQL in QUERIES.items():
+			params = QUERY_EXAMPLES[name]
+			latencies = []
+			for reader in (pool.reader, replica.reader):
+				start = time.perf_counter()
+				for _ in range(repeat):
+					reader().execute(SQL, params).fetchall()
+				latencies.append((time.perf_counter() - start) / repeat)
+			print("%-26s file %8.1fus  memory %8.1fus  %.1fx" % (name + ":", latencies[0] * 1e6, latencies[1] * 1e6,
+				latencies[0] / latencies[1]))
+			results[name] = {"file": latencies[0], "memory": latencies[1]}
+
+		with pool.writing(["Type"]) as writer:
+			writer.execute("UPDATE Type SET Speed = 0.75 WHERE Name = 'Two-Handed Sword'")
+		start = time.perf_counter()
+		swapped = replica.refresh()
+		results["swap"] = time.perf_counter() - start
+		print("Noticed the write and swapped to a fresh copy: %s, in %.3fs" % (swapped, results["swap"]))
+		replica.close()
+		pool.close()
+	finally:
+		shutil.rmtree(directory)
+	return results
+
+# PACK BENCHMARK
+# Times loading each built-in DLC pack into a freshly built in-memory
+# database, loading it again (which writes nothing) and unloading it, then
+# does the same for a synthetic mod pack of "weaponCount" weapons made of
+# new materials for the base game's types.
+# Run with "python3 -m skyrimweapondb packbench [weapons]".
+def benchmarkPacks(weaponCount=10000):
+	results = timePacks(weaponCount)
+	print("PACK BENCHMARK (mod pack of %d weapons)" % weaponCount)
+	for name, result in results.items():
+		print("%-12s load %.4fs  reload %.4fs  unload %.4fs" % (
+			name + ":", result["load"], result["reload"], result["unload"]))
+	return results
+
+# The timings of benchmarkPacks, as {pack: {"load", "reload", "unload": seconds}}
+def timePacks(weaponCount=10000):
+	random = randomModule.Random(0)
+	connect = sqlite3.connect(":memory:")
+	build(connect)
+	for name in BUILTIN_PACKS:
+		unloadPack(connect, name)
+	typeNames = [row[0] for row in connect.execute("SELECT Name FROM Type")]
+	materialNames = ["Mod Material %d" % i for i in range(max(1, weaponCount // 100))]
+	modPack = {
+		"Forgeability": [(random.randint(1, 100), "Mod Perk %d" % i) for i in range(len(materialNames))],
+		"Material": [(name, typeName, random.randint(1, 35), random.randint(1, 30), random.randint(10, 5000),
+			None, "Mod Perk %d" % i) for i, name in enumerate(materialNames) for typeName in typeNames],
+		"Weapon": [("mod%05x" % i, "Mod Weapon %d" % i, random.choice(typeNames), random.choice(materialNames))
+			for i in range(weaponCount)],
+	}
+
+	packs = [(name, lambda name=name: loadPackDirectory(connect, os.path.join(PACK_DIRECTORY, name)))
+		for name in BUILTIN_PACKS]
+	packs.append(("Mod", lambda: loadPack(connect, "Mod", modPack)))
+	results = {}
+	for name, load in packs:
+		times = []
+		for step in (load, load, lambda: unloadPack(connect, name)):
+			start = time.perf_counter()
+			step()
+			times.append(time.perf_counter() - start)
+		results[name] = dict(zip(("load", "reload", "unload"), times))
+	connect.close()
+	return results
+
+# SHARDED BUILD BENCHMARK
+# Writes "modCount" synthetic mod packs with "weaponCount" weapons between
+# them (each with its own materials and perks for the base game's types) as
+# seed directories, then builds a database from the base game, the DLCs and
+# every mod: once with build() and loadPackDirectory, one pack after the
+# other, and once with buildSharded() for 1, 2, 4, ... processes up to one
+# per CPU. Every build is checked to hold the same rows.
+# Run with "python3 -m skyrimweapondb shardbench [weapons]".
+def benchmarkShardedBuild(weaponCount=100000, modCount=32):
+	directory = tempfile.mkdtemp()
+	try:
+		modDirectory = os.path.join(directory, "mods")
+		writeSyntheticMods(modDirectory, weaponCount, modCount)
+		sources = defaultSources() + packSources(modDirectory)
+		results = {}
+		start = time.perf_counter()
+		connect = sqlite3.connect(os.path.join(directory, "sequential.db"))
+		connect.execute("PRAGMA foreign_keys = ON")
+		build(connect)
+		for path, name in packSources(modDirectory):
+			loadPackDirectory(connect, path)
+		results["sequential"] = time.perf_counter() - start
+		expected = [connect.execute('SELECT * FROM "%s" ORDER BY rowid' % table).fetchall() for table in TABLE_COLUMNS]
+		connect.close()
+		print("SHARDED BUILD BENCHMARK (%d weapons in %d mods, %d CPUs)" % (weaponCount, modCount, os.cpu_count() or 1))
+		print("build + loadPackDirectory: %.3fs" % results["sequential"])
+		processes = 1
+		while True:
+			start = time.perf_counter()
+			connect = sqlite3.connect(os.path.join(directory, "sharded%d.db" % processes))
+			connect.execute("PRAGMA foreign_keys = ON")
+			buildSharded(connect, sources, processes)
+			results[processes] = time.perf_counter() - start
+			if [connect.execute('SELECT * FROM "%s" ORDER BY rowid' % table).fetchall() for table in TABLE_COLUMNS] != expected:
+				raise AssertionError("the sharded build with %d processes holds different rows" % processes)
+			connect.close()
+			print("buildSharded, %2d processes: %.3fs (%.1fx)" % (processes, results[processes],
+				results["sequential"] / results[processes]))
+			if processes >= (os.cpu_count() or 1):
+				break
+			processes = min(processes * 2, os.cpu_count())
+	finally:
+		shutil.rmtree(directory)
+	return results
+
+# Writes the seed directories of "modCount" made-up mod packs, named
+# "Mod 000", "Mod 001", ..., with "weaponCount" weapons between them
+def writeSyntheticMods(directory, weaponCount, modCount, seed=0):
+	random = randomModule.Random(seed)
+	typeNames = [row[0] for row in readSeedFile(os.path.join(SEED_DIRECTORY, "Type.csv"), "Type")]
+	for mod in range(modCount):
+		materialNames = ["Mod %d Material %d" % (mod, i) for i in range(max(1, weaponCount // modCount // 100))]
+		tables = {
+			"Forgeability": [(random.randint(1, 100), "Mod %d Perk %d" % (mod, i)) for i in range(len(materialNames))],
+			"Material": [(name, typeName, random.randint(1, 35), random.randint(1, 30), random.randint(10, 5000),
+				None, "Mod %d Perk %d" % (mod, i)) for i, name in enumerate(materialNames) for typeName in typeNames],
+			"Weapon": [("mod%03d%06x" % (mod, i), "Mod %d Weapon %d" % (mod, i), random.choice(typeNames),
+				random.choice(materialNames)) for i in range(mod, weaponCount, modCount)],
+		}
+		packDirectory = os.path.join(directory, "Mod %03d" % mod)
+		os.makedirs(packDirectory)
+		for table, rows in tables.items():
+			with open(os.path.join(packDirectory, table + ".csv"), "w", newline="", encoding="utf-8") as file:
+				writer = csv.writer(file)
+				writer.writerow(TABLE_COLUMNS[table])
+				writer.writerows(rows)
+
+# CONCURRENCY BENCHMARK
+# Runs "readerCount" threads that loop over every registered query while one
+# writer thread keeps applying the Unofficial Patch two-handed sword speed
+# update, each through a ConnectionPool. This is done once with SQLite's
+# default rollback journal and once with the pool's WAL settings, on freshly
+# built databases, and prints queries/sec and writes/sec for both.
+# Run with "python3 -m skyrimweapondb concurrency [readers]".
+def benchmarkConcurrency(readerCount=4, seconds=2.0):
+	results = {}
+	modes = (("Rollback journal", {"journal_mode": "DELETE", "busy_timeout": 5000}), ("WAL", PRAGMAS))
+	for mode, pragmas in modes:
+		directory = tempfile.mkdtemp()
+		try:
+			pool = ConnectionPool(os.path.join(directory, "concurrency.db"), pragmas)
+			with pool.writing() as connect:
+				build(connect)
+			results[mode] = runConcurrently(pool, readerCount, seconds)
+			pool.close()
+		finally:
+			shutil.rmtree(directory)
+
+	print("CONCURRENCY BENCHMARK (%d readers, 1 writer, %.1fs)" % (readerCount, seconds))
+	for mode, result in results.items():
+		print("%-17s %8d queries/sec  %6d writes/sec  %d busy errors" % (
+			mode + ":", result["queries"], result["writes"], result["busy"]))
+	return results
+
+# The reader and writer threads of benchmarkConcurrency
+def runConcurrently(pool, readerCount, seconds):
+	stop = threading.Event()
+	counts = [0] * (readerCount + 1)
+	busy = [0] * (readerCount + 1)
+
+	def read(index):
+		connect = pool.reader()
+		while not stop.is_set():
+			for name, SQL in QUERIES.items():
+				try:
+					connect.execute(SQL, QUERY_EXAMPLES[name]).fetchall()
+					counts[index] += 1
+				except sqlite3.OperationalError:
+					busy[index] += 1
+
+	def write():
+		speed = 0.75
+		while not stop.is_set():
+			speed = 0.7 if speed == 0.75 else 0.75
+			try:
+				with pool.writing(["Type"]) as connect:
+					connect.execute("UPDATE Type SET Speed = ? WHERE Name = ?", (speed, "Two-Handed Sword"))
+				counts[-1] += 1
+			except sqlite3.OperationalError:
+				busy[-1] += 1
+
+	threads = [threading.Thread(target=read, args=(index,)) for index in range(readerCount)]
+	threads.append(threading.Thread(target=write))
+	for thread in threads:
+		thread.start()
+	time.sleep(seconds)
+	stop.set()
+	for thread in threads:
+		thread.join()
+	return {"queries": sum(counts[:-1]) / seconds, "writes": counts[-1] / seconds, "busy": sum(busy)}
+
+# BENCHMARK SUITE
+# Builds synthetic catalogs of 10^3, 10^4, ... weapons, up to "maxWeapons",
+# each in its own database file, and times against each one: loading it,
+# every query function (with the read cache cleared, best of "repeat"
+# runs), building the loadout optimizer and asking it for the best weapons
+# by every score, a prefix search of the weapons and the enchantments,
+# exporting a snapshot, opening it and reading a stat sheet from it, and
+# restoring it into memory, a 1000-change patch, a type update that touches
+# an eighth of the weapons, deleting 1% of the weapons by ID and a whole
+# material by predicate, exporting those changes and applying them to the
+# restored snapshot, and loading the DLC packs and a mod pack a tenth the
+# size.
+# It also records the database file size and the peak RSS of the process
+# so far.
+# The results are written as JSON to "output". If that file already holds
+# the results of an earlier run, every timing that got more than
+# "tolerance" times slower is reported as a regression, and the file is
+# left as it is, so the next run is still compared against the earlier
+# results.
+# Run with "python3 -m skyrimweapondb suite [weapons]".
+BENCHMARK_RESULTS = "benchmark_results.json"
+
+# The query functions the suite times, with the arguments after "connect"
+SUITE_QUERIES = {
+	"selectIronWeapons": (selectIronWeapons, (False,)),
+	"selectBowsBySpeed": (selectBowsBySpeed, (False,)),
+	"selectEnchantedWeapons": (selectEnchantedWeapons, (False,)),
+	"selectForgeabilityPerkLevel": (selectForgeabilityPerkLevel, (False,)),
+	"selectAllDwarvenAxes": (selectAllDwarvenAxes, (False,)),
+	"selectEnchantmentsForWarhammers": (selectEnchantmentsForWarhammers, (False,)),
+	"selectHighestDamage": (selectHighestDamage, (False,)),
+	"selectWeaponStats": (selectWeaponStats, ("%08x" % 1,)),
+	"selectWeaponStatSheet": (selectWeaponStatSheet, ("%08x" % 1,)),
+}
+
+# Returns the peak resident set size of this process in KiB, or None where
+# the resource module is not available
+def peakRSS():
+	if resource is None:
+		return None
+	peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	# macOS reports bytes, Linux KiB
+	return peak // 1024 if sys.platform == "darwin" else peak
+
+# Calls function(*args) "repeat" times, clearing the read cache before
+# each call, and returns the fastest time in seconds
+def bestTime(function, args, repeat=1):
+	times = []
+	for _ in range(repeat):
+		queryCache.clear()
+		start = time.perf_counter()
+		function(*args)
+		times.append(time.perf_counter() - start)
+	return min(times)
+
+# Runs the suite's benchmarks against one catalog of "weaponCount" weapons
+# and returns its results
+def benchmarkCatalog(weaponCount, directory, repeat=5):
+	path = os.path.join(directory, "catalog_%d.db" % weaponCount)
+	connect = sqlite3.connect(path)
+	createTables(connect)
+	seconds = {}
+	counts = {}
+
+	start = time.perf_counter()
+	counts["seed"] = sum(bulkLoad(connect, syntheticTables(weaponCount)).values())
+	seconds["seed"] = time.perf_counter() - start
+	for name, (function, args) in SUITE_QUERIES.items():
+		seconds["query." + name] = bestTime(function, (connect,) + args, repeat)
+
+	optimizer = LoadoutOptimizer(connect)
+	seconds["loadout.build"] = bestTime(optimizer.refresh, ())
+	# Without clearing the read cache, which would make best() rebuild
+	start = time.perf_counter()
+	for score in SCORES:
+		optimizer.best(10, score, level=50, maxWeight=20, enchanted=True)
+	seconds["loadout.best"] = time.perf_counter() - start
+
+	seconds["search.weapons"] = bestTime(searchWeapons, (connect, "Weapon 42"), repeat)
+	seconds["search.enchantments"] = bestTime(searchEnchantments, (connect, "effect ench"), repeat)
+
+	snapshotPath = os.path.join(directory, "catalog_%d.snapshot" % weaponCount)
+	start = time.perf_counter()
+	exportSnapshot(connect, snapshotPath)
+	seconds["snapshot.export"] = time.perf_counter() - start
+	start = time.perf_counter()
+	snapshot = openSnapshot(snapshotPath)
+	selectWeaponStatSheet(snapshot, "%08x" % 1)
+	seconds["snapshot.open"] = time.perf_counter() - start
+	snapshot.close()
+	restored = sqlite3.connect(":memory:")
+	start = time.perf_counter()
+	restoreSnapshot(restored, snapshotPath)
+	seconds["snapshot.restore"] = time.perf_counter() - start
+	counts["snapshotBytes"] = os.path.getsize(snapshotPath)
+
+	materials = connect.execute("SELECT Name, Type, Damage FROM Material LIMIT 1000").fetchall()
+	changes = [Change("Material", (name, type), {"Damage": damage + 1}) for name, type, damage in materials]
+	counts["patch"] = len(changes)
+	seconds["patch"] = bestTime(applyPatch, (connect, changes))
+	seconds["typeUpdate"] = bestTime(applyPatch, (connect, [Change("Type", ("Two-Handed Sword",), {"Speed": 0.75})]))
+
+	IDs = ["%08x" % i for i in range(0, weaponCount, 100)]
+	start = time.perf_counter()
+	counts["deleteIDs"] = deleteWeapons(connect, IDs)["Weapon"]
+	seconds["deleteIDs"] = time.perf_counter() - start
+	start = time.perf_counter()
+	counts["deleteMaterial"] = deleteWeapons(connect, where="Material = ?", params=("Steel",))["Weapon"]
+	seconds["deleteMaterial"] = time.perf_counter() - start
+
+	# The restored snapshot catches up with the patch and the deletions
+	changePath = os.path.join(directory, "catalog_%d.changes" % weaponCount)
+	start = time.perf_counter()
+	counts["changes"] = writeChangeFile(changePath, exportChanges(connect, syncPosition(restored)))
+	seconds["changes.export"] = time.perf_counter() - start
+	counts["changeBytes"] = os.path.getsize(changePath)
+	start = time.perf_counter()
+	applyChanges(restored, readChangeFile(changePath))
+	seconds["changes.apply"] = time.perf_counter() - start
+	restored.close()
+	connect.close()
+
+	for name, result in timePacks(max(100, weaponCount // 10)).items():
+		for step, stepSeconds in result.items():
+			seconds["pack.%s.%s" % (name, step)] = stepSeconds
+	return {"weapons": weaponCount, "seconds": seconds, "counts": counts,
+		"fileBytes": os.path.getsize(path), "peakRSSKiB": peakRSS()}
+
+# Returns the timings of "current" that are more than "tolerance" times
+# slower than in "previous", as (weapons, timing, previous, current) tuples.
+# Timings under a millisecond are too noisy to compare and are skipped.
+def compareResults(previous, current, tolerance=1.5):
+	regressions = []
+	previousRuns = {run["weapons"]: run for run in previous.get("runs", ())}
+	for run in current["runs"]:
+		previousRun = previousRuns.get(run["weapons"])
+		if previousRun is None:
+			continue
+		for name, seconds in run["seconds"].items():
+			before = previousRun["seconds"].get(name)
+			if before is not None and seconds > 0.001 and seconds > before * tolerance:
+				regressions.append((run["weapons"], name, before, seconds))
+	return regressions
+
+# Runs the suite and returns its results and regressions
+def runBenchmarkSuite(maxWeapons=100000, output=BENCHMARK_RESULTS, repeat=5, tolerance=1.5):
+	previous = None
+	if output is not None and os.path.exists(output):
+		with open(output) as file:
+			previous = json.load(file)
+	results = {"sqlite": sqlite3.sqlite_version, "python": platform.python_version(), "runs": []}
+	directory = tempfile.mkdtemp()
+	try:
+		weaponCount = 1000
+		while weaponCount <= maxWeapons:
+			run = benchmarkCatalog(weaponCount, directory, repeat)
+			results["runs"].append(run)
+			seconds = run["seconds"]
+			print("%9d weapons: seed %.3fs (%d rows/sec), queries %.4fs, patch %.3fs, deletes %.3fs, %d KiB file, %s KiB peak RSS" % (
+				weaponCount, seconds["seed"], run["counts"]["seed"] / seconds["seed"],
+				sum(value for name, value in seconds.items() if name.startswith("query.")),
+				seconds["patch"], seconds["deleteIDs"] + seconds["deleteMaterial"],
+				run["fileBytes"] // 1024, run["peakRSSKiB"]))
+			weaponCount *= 10
+	finally:
+		shutil.rmtree(directory)
+
+	regressions = compareResults(previous, results, tolerance) if previous else []
+	for weaponCount, name, before, seconds in regressions:
+		print("REGRESSION: %s at %d weapons took %.4fs, was %.4fs" % (name, weaponCount, seconds, before))
+	if output is not None and regressions:
+		print("Results not written, %s keeps the earlier results to compare against" % output)
+	elif output is not None:
+		with open(output, "w") as file:
+			json.dump(results, file, indent=2)
+		print("Results written to %s" % output)
+	return results, regressions
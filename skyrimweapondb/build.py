@@ -0,0 +1,28 @@
+# BUILD
+# The explicit entry points that create and fill the database. Nothing here
+# runs on import; call build() (or seed() on a database that already has
+# its tables) with a connection, or with none to use getConnection().
+import os
+
+from .connection import getConnection
+from .importer import SEED_DIRECTORY, importSeedFiles
+from .packs import BUILTIN_PACKS, PACK_DIRECTORY, loadPackDirectory
+from .schema import createTables
+
+# Writes the base game data from the seed files in "directory" (see
+# importer.py). Every table's rows are written with one syncTables call
+# instead of committing each row on its own. Rows that are already in the
+# database are only updated when their values changed.
+# Returns the number of rows written per table.
+def seed(connect=None, directory=SEED_DIRECTORY):
+	connect = connect or getConnection()
+	return importSeedFiles(connect, directory)
+
+# Creates the schema, then seeds the base game and loads both DLCs
+def build(connect=None):
+	connect = connect or getConnection()
+	createTables(connect)
+	seed(connect)
+	for name in BUILTIN_PACKS:
+		loadPackDirectory(connect, os.path.join(PACK_DIRECTORY, name), adopt=True)
+	return connect
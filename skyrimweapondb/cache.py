@@ -0,0 +1,78 @@
+import collections
+import threading
+
+# READ CACHE
+# The data only changes when one of the create, update or deletion helpers
+# runs, so query results are kept in memory and reused until then.
+# Results are keyed by connection, SQL and parameters, and each one remembers
+# the tables it was read from. When a helper writes to a table it calls
+# invalidate(), which drops every result that read that table. Only the
+# "maxSize" most recently used results are kept.
+# The pool, the replica and closeConnection() call forget() before they
+# close a connection, so the keys don't keep closed connections alive.
+# The cache is shared by every thread of the connection pool, so all of its
+# state is guarded by one lock. The query itself runs outside the lock.
+# Deleting rows of these tables also deletes rows of the tables listed, by
+# the foreign keys' ON DELETE CASCADE, so invalidating one invalidates them
+CASCADES = {
+	"Weapon": ("EnchantedWith",),
+	"Enchanting": ("EnchantedWith",),
+}
+
+class QueryCache:
+	def __init__(self, maxSize=256):
+		self.maxSize = maxSize
+		self.entries = collections.OrderedDict()
+		self.hits = 0
+		self.misses = 0
+		self.lock = threading.Lock()
+		# Bumped on every invalidation, so a result read while its table was
+		# being written is not stored after the invalidation already ran
+		self.generation = 0
+
+	# Returns the rows of SQL as a tuple, running it only on a cache miss.
+	# "tables" lists every table the query reads.
+	def fetch(self, connect, SQL, params=(), tables=()):
+		key = (connect, SQL, tuple(params))
+		with self.lock:
+			entry = self.entries.get(key)
+			if entry is not None:
+				self.entries.move_to_end(key)
+				self.hits += 1
+				return entry[1]
+			self.misses += 1
+			generation = self.generation
+		rows = tuple(connect.execute(SQL, params).fetchall())
+		with self.lock:
+			if generation == self.generation:
+				self.entries[key] = (frozenset(tables), rows)
+				if len(self.entries) > self.maxSize:
+					self.entries.popitem(last=False)
+		return rows
+
+	# Drops every cached result that was read from "table", or from a table
+	# its deletions cascade to
+	def invalidate(self, table):
+		tables = {table, *CASCADES.get(table, ())}
+		with self.lock:
+			self.generation += 1
+			for key in [key for key, entry in self.entries.items() if not tables.isdisjoint(entry[0])]:
+				del self.entries[key]
+
+	# Drops every cached result of a connection that is being closed, so
+	# the cache doesn't keep it alive
+	def forget(self, connect):
+		with self.lock:
+			for key in [key for key in self.entries if key[0] is connect]:
+				del self.entries[key]
+
+	def clear(self):
+		with self.lock:
+			self.generation += 1
+			self.entries.clear()
+
+	def stats(self):
+		with self.lock:
+			return {"hits": self.hits, "misses": self.misses, "size": len(self.entries), "maxSize": self.maxSize}
+
+queryCache = QueryCache()
@@ -0,0 +1,192 @@
+# WEAPON CATALOG
+# The whole catalog held in the process, for services that look weapons up
+# far more often than the database changes, e.g. a damage calculator that
+# needs a weapon's stats on every hit. A WeaponCatalog reads the Weapon,
+# Type, Material and Forgeability tables ONCE and answers lookups from
+# dictionaries, without SQLite:
+#	catalog = WeaponCatalog(getConnection())
+#	catalog.get("00012eb7")                       # by ID, O(1)
+#	catalog.find(material="Iron")                 # selectIronWeapons, O(k)
+#	catalog.find(material="Dwarven", type="One-Handed Axe")
+# Instead of a tuple per weapon, the stats are kept in typed arrays
+# (array.array), one per column, and every type, material and perk name is
+# stored once, interned, with the weapons holding its integer code. The
+# material stats are stored once per (material, type) row and the type
+# stats once per type, as in the tables, rather than copied into every
+# weapon. Lookups return CatalogWeapon records, built when asked for.
+# The catalog is a copy: make a new one after writing to the database.
+import array
+import collections
+import math
+import sys
+
+# The stat sheet of one weapon: the columns of WeaponStats, without the
+# enchantments. Stats a weapon doesn't have (e.g. the type speed of a bow)
+# are None.
+CatalogWeapon = collections.namedtuple("CatalogWeapon",
+	"ID Name Type Material TypeSpeed Stagger Reach Weight Damage Value MaterialSpeed Forgeability ForgeLevel")
+
+CATALOG_SQL = {
+	"Type": "SELECT Name, Speed, Stagger, Reach FROM Type",
+	"Forgeability": "SELECT Perk_Name, Level FROM Forgeability",
+	"Material": "SELECT Name, Type, Weight, Damage, Value, Speed, Forgeability FROM Material",
+	"Weapon": "SELECT ID, Name, Type, Material FROM Weapon ORDER BY rowid",
+}
+
+# Stored in the "d" arrays in place of NULL
+MISSING = math.nan
+
+# Returns a stored number as it was in the database
+def restore(value, cast=float):
+	return None if math.isnan(value) else cast(value)
+
+class WeaponCatalog:
+	def __init__(self, connect, arraysize=4096):
+		# The interned names of the types, materials and perks; a code is a
+		# position in one of these lists
+		self.types = []
+		self.materials = []
+		self.perks = []
+		self.typeCodes = {}
+		self.materialCodes = {}
+		self.perkCodes = {}
+		# Type stats, by type code
+		self.typeSpeed = array.array("d")
+		self.stagger = array.array("d")
+		self.reach = array.array("d")
+		# Perk levels, by perk code
+		self.perkLevel = array.array("d")
+		# Material stats, one entry per Material row
+		self.weight = array.array("d")
+		self.damage = array.array("l")
+		self.value = array.array("l")
+		self.materialSpeed = array.array("d")
+		self.materialPerk = array.array("i")
+		# Weapons, by position. A weapon's material row is -1 when the
+		# Material table has no row for its (material, type).
+		self.ids = []
+		self.names = []
+		self.weaponType = array.array("i")
+		self.weaponMaterial = array.array("i")
+		self.materialRow = array.array("i")
+		# The indexes, which hold weapon positions. Names are nearly always
+		# unique, so byName holds a single position, and a list only for a
+		# name that several weapons share.
+		self.byID = {}
+		self.byName = {}
+		self.byType = {}
+		self.byMaterial = {}
+		self.byMaterialType = {}
+		rows = {}
+		for row in self.read(connect, "Type", arraysize):
+			code = self.code(self.types, self.typeCodes, row[0])
+			for column, value in zip((self.typeSpeed, self.stagger, self.reach), row[1:]):
+				column.extend([MISSING] * (code + 1 - len(column)))
+				column[code] = MISSING if value is None else value
+		for name, level in self.read(connect, "Forgeability", arraysize):
+			code = self.code(self.perks, self.perkCodes, name)
+			self.perkLevel.extend([MISSING] * (code + 1 - len(self.perkLevel)))
+			self.perkLevel[code] = MISSING if level is None else level
+		for name, type, weight, damage, value, speed, perk in self.read(connect, "Material", arraysize):
+			key = (self.code(self.materials, self.materialCodes, name), self.code(self.types, self.typeCodes, type))
+			rows[key] = len(self.weight)
+			self.weight.append(weight)
+			self.damage.append(damage)
+			self.value.append(value)
+			self.materialSpeed.append(MISSING if speed is None else speed)
+			self.materialPerk.append(-1 if perk is None else self.code(self.perks, self.perkCodes, perk))
+		for ID, name, type, material in self.read(connect, "Weapon", arraysize):
+			position = len(self.ids)
+			typeCode = self.code(self.types, self.typeCodes, type)
+			materialCode = self.code(self.materials, self.materialCodes, material)
+			self.ids.append(ID)
+			self.names.append(name)
+			self.weaponType.append(typeCode)
+			self.weaponMaterial.append(materialCode)
+			self.materialRow.append(rows.get((materialCode, typeCode), -1))
+			self.byID[ID] = position
+			if name not in self.byName:
+				self.byName[name] = position
+			elif isinstance(self.byName[name], int):
+				self.byName[name] = [self.byName[name], position]
+			else:
+				self.byName[name].append(position)
+			self.index(self.byType, self.types[typeCode], position)
+			self.index(self.byMaterial, self.materials[materialCode], position)
+			self.index(self.byMaterialType, (self.materials[materialCode], self.types[typeCode]), position)
+		# Types and perks only named by other tables have no stats
+		for column in (self.typeSpeed, self.stagger, self.reach):
+			column.extend([MISSING] * (len(self.types) - len(column)))
+		self.perkLevel.extend([MISSING] * (len(self.perks) - len(self.perkLevel)))
+
+	# Yields the rows of one of CATALOG_SQL's queries, a batch at a time
+	def read(self, connect, table, arraysize):
+		cursor = connect.cursor()
+		cursor.arraysize = arraysize
+		try:
+			cursor.execute(CATALOG_SQL[table])
+			rows = cursor.fetchmany()
+			while rows:
+				yield from rows
+				rows = cursor.fetchmany()
+		finally:
+			cursor.close()
+
+	# Returns the code of a name in "labels", interning and adding it first
+	# if it's new
+	def code(self, labels, codes, name):
+		if name not in codes:
+			codes[name] = len(labels)
+			labels.append(sys.intern(name))
+		return codes[name]
+
+	# Adds a weapon position to the index entry of "key"
+	def index(self, index, key, position):
+		if key not in index:
+			index[key] = array.array("i")
+		index[key].append(position)
+
+	def __len__(self):
+		return len(self.ids)
+
+	# Returns the CatalogWeapon at a position
+	def __getitem__(self, position):
+		if not 0 <= position < len(self.ids):
+			raise IndexError("catalog position out of range")
+		type = self.weaponType[position]
+		row = self.materialRow[position]
+		stats = (restore(self.typeSpeed[type]), restore(self.stagger[type]), restore(self.reach[type]))
+		if row < 0:
+			return CatalogWeapon(self.ids[position], self.names[position], self.types[type],
+				self.materials[self.weaponMaterial[position]], *stats, None, None, None, None, None, None)
+		perk = self.materialPerk[row]
+		return CatalogWeapon(self.ids[position], self.names[position], self.types[type],
+			self.materials[self.weaponMaterial[position]], *stats,
+			self.weight[row], self.damage[row], self.value[row], restore(self.materialSpeed[row]),
+			None if perk < 0 else self.perks[perk], None if perk < 0 else restore(self.perkLevel[perk], int))
+
+	# Returns the weapon with an ID, or None
+	def get(self, ID):
+		position = self.byID.get(ID)
+		return None if position is None else self[position]
+
+	# Returns the weapons with a name, in the order they were added
+	def named(self, name):
+		positions = self.byName.get(name, ())
+		if isinstance(positions, int):
+			return [self[positions]]
+		return [self[position] for position in positions]
+
+	# Returns the weapons of a material and/or type, in the order they were
+	# added, e.g. find(material="Dwarven", type="Two-Handed Axe"). With
+	# neither, returns every weapon.
+	def find(self, material=None, type=None):
+		if material is not None and type is not None:
+			positions = self.byMaterialType.get((material, type), ())
+		elif material is not None:
+			positions = self.byMaterial.get(material, ())
+		elif type is not None:
+			positions = self.byType.get(type, ())
+		else:
+			positions = range(len(self.ids))
+		return [self[position] for position in positions]
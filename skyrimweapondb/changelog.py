@@ -0,0 +1,163 @@
+# CHANGE LOG SYNC
+# Every change to the six base tables is recorded in the ChangeLog table by
+# triggers (see the CHANGE LOG section of schema.py), numbered in the order
+# it happened. Copies of the database are kept up to date by shipping the
+# changes instead of the whole file:
+#	changes = exportChanges(source, since=syncPosition(copy))
+#	applyChanges(copy, changes)
+# or, between machines, with a change file:
+#	writeChangeFile("delta.jsonl", exportChanges(source, since=1234))
+#	applyChanges(copy, readChangeFile("delta.jsonl"))
+# A copy must start out as a copy of the source's file (e.g. a snapshot, see
+# snapshot.py): it then holds the source's change log up to the moment it
+# was copied, and its first sync starts from there. After that, ChangeSync
+# records the last change the copy applied.
+# Applied changes are recorded in the copy's own change log as well, so a
+# copy can be the source of further copies. Databases built by
+# buildSharded(), which skips the triggers, start with an empty log.
+# A change file is a JSON lines file with one change per line:
+#	{"sequence": 1235, "table": "Material", "operation": "UPDATE",
+#	 "key": ["Ebony", "One-Handed Mace"], "row": {"Name": "Ebony", ...}}
+import collections
+import itertools
+import json
+import sqlite3
+
+from .loader import transaction
+from .schema import PACK_TABLES, TABLE_COLUMNS, TABLE_KEYS
+
+# The source a copy syncs from unless told otherwise
+DEFAULT_SOURCE = "primary"
+OPERATIONS = ("INSERT", "UPDATE", "DELETE")
+
+# One recorded change. "key" holds the row's TABLE_KEYS values before the
+# change and "row" maps every column to its value after it (None for a
+# DELETE).
+LoggedChange = collections.namedtuple("LoggedChange", "sequence table operation key row")
+
+# Returns the sequence number of the last change recorded in a database's
+# change log, or 0 if there is none
+def latestSequence(connect):
+	row = connect.execute("SELECT seq FROM sqlite_sequence WHERE name = 'ChangeLog'").fetchone()
+	return 0 if row is None else row[0]
+
+# Returns the last change of "source" that a copy holds
+def syncPosition(connect, source=DEFAULT_SOURCE):
+	row = connect.execute("SELECT Sequence FROM ChangeSync WHERE Source = ?", (source,)).fetchone()
+	return latestSequence(connect) if row is None else row[0]
+
+# Returns the changes after sequence number "since", oldest first, at most
+# "limit" of them. Raises ValueError if some of them were already pruned,
+# in which case the copy has to be replaced by a new copy of the file.
+def exportChanges(connect, since=0, limit=None):
+	cursor = connect.cursor()
+	cursor.execute("SELECT MIN(Sequence) FROM ChangeLog")
+	oldest = cursor.fetchone()[0]
+	latest = latestSequence(connect)
+	if since < latest and (oldest is None or oldest > since + 1):
+		raise ValueError("the changes after %d were pruned, the change log starts at %d"
+			% (since, latest + 1 if oldest is None else oldest))
+	cursor.execute('''SELECT Sequence, TableName, Operation, RowKey, RowData FROM ChangeLog
+		WHERE Sequence > ? ORDER BY Sequence LIMIT ?''', (since, -1 if limit is None else limit))
+	return [LoggedChange(sequence, table, operation, tuple(json.loads(key)), None if row is None else json.loads(row))
+		for sequence, table, operation, key, row in cursor.fetchall()]
+
+# Deletes the changes up to and including sequence number "through", once
+# every copy has applied them. Returns the number of changes deleted.
+def pruneChanges(connect, through):
+	cursor = connect.cursor()
+	cursor.execute("DELETE FROM ChangeLog WHERE Sequence <= ?", (through,))
+	connect.commit()
+	return cursor.rowcount
+
+# Returns the columns a change of "table" carries
+def changeColumns(table):
+	return TABLE_COLUMNS[table] + (("Pack",) if table in PACK_TABLES else ())
+
+# Returns the statement that applies one kind of change to "table"
+def changeSQL(table, operation):
+	columns = changeColumns(table)
+	where = " AND ".join('"%s" = ?' % column for column in TABLE_KEYS[table])
+	if operation == "INSERT":
+		return 'INSERT INTO "%s" (%s) VALUES (%s)' % (table, ", ".join(columns), ", ".join("?" * len(columns)))
+	if operation == "UPDATE":
+		return 'UPDATE "%s" SET %s WHERE %s' % (table, ", ".join('"%s" = ?' % column for column in columns), where)
+	return 'DELETE FROM "%s" WHERE %s' % (table, where)
+
+# Returns the parameters of changeSQL for one change
+def changeParameters(change):
+	columns = changeColumns(change.table)
+	if change.operation == "INSERT":
+		return tuple(change.row.get(column) for column in columns)
+	if change.operation == "UPDATE":
+		return tuple(change.row.get(column) for column in columns) + tuple(change.key)
+	return tuple(change.key)
+
+# Applies the changes of "source" that a copy doesn't hold yet, oldest
+# first, in ONE transaction, and records how far the copy got. Changes it
+# already holds are skipped, so applying the same changes twice is safe.
+# Raises ValueError, and applies nothing, if:
+#	- changes are missing between the copy's position and the first new one,
+#	- an INSERT finds its row already there, or an UPDATE doesn't find its
+#	  row: the copy no longer matches the source.
+# A DELETE whose row is already gone (e.g. removed by a cascade) is fine.
+# Returns the number of changes applied.
+def applyChanges(connect, changes, source=DEFAULT_SOURCE):
+	tables = set()
+	with transaction(connect, tables) as cursor:
+		# The changes of one statement may come in an order that breaks a
+		# foreign key for a moment, e.g. a child row deleted after its parent
+		cursor.execute("PRAGMA defer_foreign_keys = ON")
+		position = syncPosition(connect, source)
+		applied = 0
+		pending = []
+		for change in changes:
+			change = change if isinstance(change, LoggedChange) else LoggedChange(*change)
+			if change.sequence <= position:
+				continue
+			if change.sequence != position + 1:
+				raise ValueError("the changes between %d and %d are missing" % (position, change.sequence))
+			if change.table not in TABLE_KEYS or change.operation not in OPERATIONS:
+				raise ValueError("change %d is not a valid change" % change.sequence)
+			pending.append(change)
+			position = change.sequence
+		# Neighbouring changes of the same kind share one executemany
+		for (table, operation), run in itertools.groupby(pending, lambda change: (change.table, change.operation)):
+			run = list(run)
+			tables.add(table)
+			try:
+				cursor.executemany(changeSQL(table, operation), [changeParameters(change) for change in run])
+			except sqlite3.IntegrityError as error:
+				raise ValueError("changes %d to %d don't fit this copy (%s): it no longer matches the source"
+					% (run[0].sequence, run[-1].sequence, error)) from None
+			if operation == "UPDATE" and cursor.rowcount != len(run):
+				raise ValueError("changes %d to %d update %s rows this copy doesn't have: it no longer matches the source"
+					% (run[0].sequence, run[-1].sequence, table))
+			applied += len(run)
+		cursor.execute('''INSERT INTO ChangeSync (Source, Sequence) VALUES (?, ?)
+			ON CONFLICT(Source) DO UPDATE SET Sequence = excluded.Sequence''', (source, position))
+	return applied
+
+# Writes changes to a change file (see above) and returns how many it wrote
+def writeChangeFile(path, changes):
+	count = 0
+	with open(path, "w", encoding="utf-8") as file:
+		for change in changes:
+			file.write(json.dumps({"sequence": change.sequence, "table": change.table, "operation": change.operation,
+				"key": list(change.key), "row": change.row}) + "\n")
+			count += 1
+	return count
+
+# Reads a change file one line at a time and yields its changes
+def readChangeFile(path):
+	with open(path, encoding="utf-8") as file:
+		for number, line in enumerate(file, 1):
+			if not line.strip():
+				continue
+			try:
+				entry = json.loads(line)
+				change = LoggedChange(int(entry["sequence"]), entry["table"], entry["operation"],
+					tuple(entry["key"]), entry["row"])
+			except (KeyError, TypeError, ValueError) as error:
+				raise ValueError("%s line %d: not a valid change (%s)" % (path, number, error)) from None
+			yield change
@@ -0,0 +1,54 @@
+import sqlite3
+
+from .cache import queryCache
+from .profiler import ProfiledConnection
+from .statements import STATEMENT_CACHE_SIZE
+
+# CONNECTION
+# The database file is only opened the first time something asks for it,
+# so importing the package does no I/O at all.
+DATABASE = "SkyrimWeaponsDB.db"
+connection = None
+
+# When set, every connection is opened as a ProfiledConnection, so each
+# statement is timed and counted in profiler.profiler (see profiler.py)
+PROFILE = False
+
+# Opens a connection to "database", profiled if profiling is on, with a
+# statement cache big enough for every registered statement
+def openConnection(database, **kwargs):
+	kwargs.setdefault("cached_statements", STATEMENT_CACHE_SIZE)
+	if PROFILE:
+		kwargs["factory"] = ProfiledConnection
+	return sqlite3.connect(database, **kwargs)
+
+# Returns the shared connection, opening it on first use.
+# Foreign keys are enforced on it, so deleting a weapon also deletes its
+# EnchantedWith rows.
+def getConnection():
+	global connection
+	if connection is None:
+		connection = openConnection(DATABASE)
+		connection.execute("PRAGMA foreign_keys = ON")
+	return connection
+
+# Points getConnection at another database file (or ":memory:").
+# The current connection, if any, is closed.
+def setDatabase(path):
+	global DATABASE
+	closeConnection()
+	DATABASE = path
+
+# Turns profiling of every new connection on or off. The current
+# connection, if any, is closed so the next one is opened the new way.
+def setProfiling(enabled):
+	global PROFILE
+	closeConnection()
+	PROFILE = enabled
+
+def closeConnection():
+	global connection
+	if connection is not None:
+		queryCache.forget(connection)
+		connection.close()
+		connection = None
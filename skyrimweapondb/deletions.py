@@ -0,0 +1,71 @@
+# DELETIONS
+from .loader import chunked, transaction
+from .statements import DELETION_STATEMENTS
+
+# BULK DELETION
+# Deletes many weapons with ONE DELETE statement, in one transaction. The
+# weapons are given as a list of IDs, as a predicate (an SQL condition on
+# the columns of the ResolvedWeapon view, with "?" parameters in "params"),
+# or both, in which case a weapon matching either is deleted, e.g.
+#	deleteWeapons(connect, where="Material = ? AND Damage < ?", params=("Iron", 10))
+# The IDs are gathered in a temporary table that the DELETE joins against.
+# Foreign keys cascade the deletion to the weapons' EnchantedWith rows.
+# Returns the number of rows deleted per table.
+def deleteWeapons(connect, IDs=(), where=None, params=()):
+	counts = {}
+	# Rolling back also drops the temporary table
+	with transaction(connect, counts) as cursor:
+		cursor.execute("CREATE TEMP TABLE DeletedWeapon (ID TEXT PRIMARY KEY)")
+		for chunk in chunked(((ID,) for ID in IDs), 1000):
+			cursor.executemany(DELETION_STATEMENTS["stage"], chunk)
+		if where is not None:
+			cursor.execute("INSERT OR IGNORE INTO DeletedWeapon SELECT ID FROM ResolvedWeapon WHERE %s" % where, params)
+		# The cascade is not counted by rowcount, so its rows are counted first
+		cursor.execute(DELETION_STATEMENTS["countEnchantments"])
+		enchantments = cursor.fetchone()[0]
+		cursor.execute(DELETION_STATEMENTS["delete"])
+		counts["Weapon"] = cursor.rowcount
+		counts["EnchantedWith"] = enchantments
+		cursor.execute("DROP TABLE temp.DeletedWeapon")
+	return counts
+
+# Deletes the materials given as (Name, Type) pairs that no weapon uses any
+# more, in one transaction. Returns the number of rows deleted per table.
+def deleteUnusedMaterials(connect, materials):
+	counts = {}
+	with transaction(connect, counts) as cursor:
+		cursor.executemany(DELETION_STATEMENTS["unusedMaterial"], materials)
+		counts["Material"] = cursor.rowcount
+	return counts
+
+# Deletes the weapons named in "deletion" and prints them before and after
+def deleteNamedWeapon(connect, title, deletion):
+	cursor = connect.cursor()
+	cursor.execute("SELECT ID, Name, Type, Material FROM Weapon WHERE Name = ?", deletion)
+	print("BEFORE " + title)
+	for row in cursor.fetchall():
+		print(row)
+	counts = deleteWeapons(connect, where="Name = ?", params=deletion)
+	cursor.execute("SELECT ID, Name, Type, Material FROM Weapon WHERE Name = ?", deletion)
+	print("AFTER UPDATE")
+	for row in cursor.fetchall():
+		print(row)
+	print()
+	return counts
+
+def deleteIronBow(connect, deletion):
+	return deleteNamedWeapon(connect, "IRON BOW DELETIONS", deletion)
+
+def deleteSteelBow(connect, deletion):
+	return deleteNamedWeapon(connect, "IRON BOW DELETIONS", deletion)
+
+# Applies every deletion above, printing each row before and after
+def applyDeletions(connect):
+	print()
+	print("DELETIONS BELOW")
+	deletion = (("Iron Bow",))
+	deleteIronBow(connect, deletion)
+	deletion = (("Steel Bow",))
+	deleteSteelBow(connect, deletion)
+	# The made up bow materials only exist for the two bows above
+	deleteUnusedMaterials(connect, [("Iron", "Bow"), ("Steel", "Bow")])
@@ -0,0 +1,149 @@
+# SEED FILES
+# The seed data lives in one file per table under the "seed" directory,
+# instead of in Python lists, so a catalog (or a mod's catalog of 100k
+# weapons) can be loaded without editing any code.
+# A table's file is either:
+#	<Table>.csv    a header row naming the columns, then one row per line.
+#	               An empty cell is NULL. Lines starting with "#" are
+#	               comments and blank lines are skipped.
+#	<Table>.jsonl  one JSON value per line: either a list of the values in
+#	               TABLE_COLUMNS order or an object keyed by column name.
+# Files are read one row at a time and handed to the loader in chunks, so
+# memory use does not grow with the size of the file.
+import csv
+import json
+import os
+import sqlite3
+
+from .loader import syncTables
+from .schema import COLUMN_TYPES, TABLE_COLUMNS, TABLE_KEYS
+
+SEED_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seed")
+
+# The order the tables are loaded in: every table comes after the tables
+# its foreign keys point at.
+SEED_ORDER = ("Type", "Forgeability", "Material", "Weapon", "Enchanting", "EnchantedWith")
+
+SEED_FORMATS = (".csv", ".jsonl")
+
+# Returns the columns of a table that may not be NULL: its key columns and
+# every column declared NOT NULL.
+def requiredColumns(connect, table):
+	cursor = connect.cursor()
+	cursor.execute('SELECT name FROM pragma_table_info(?) WHERE "notnull"', (table,))
+	return set(TABLE_KEYS[table]) | {row[0] for row in cursor.fetchall()}
+
+# Converts one value read from a seed file to its column's type.
+# Raises ValueError, naming the file, line and column, when it can't.
+def convertValue(value, kind, column, required, where):
+	if value is None or value == "":
+		if column in required:
+			raise ValueError("%s: %s may not be empty" % (where, column))
+		return None
+	if kind is str:
+		if not isinstance(value, str):
+			raise ValueError("%s: %s must be text, not %r" % (where, column, value))
+		return value
+	if isinstance(value, bool) or (kind is int and isinstance(value, float)):
+		raise ValueError("%s: %s must be %s, not %r" % (where, column, kind.__name__, value))
+	try:
+		return kind(value)
+	except (TypeError, ValueError):
+		raise ValueError("%s: %s must be %s, not %r" % (where, column, kind.__name__, value)) from None
+
+# Yields the lines of a file with their line numbers, leaving out blank
+# lines and, when "comments" is set, lines starting with "#"
+def numberedLines(file, comments):
+	for number, line in enumerate(file, 1):
+		if line.strip() and not (comments and line.startswith("#")):
+			yield number, line
+
+# Yields (line number, values) for every row of a CSV seed file, with the
+# values put in TABLE_COLUMNS order using the file's header row
+def readCSV(file, table, name):
+	lines = numberedLines(file, comments=True)
+	current = [0]
+	def trackLines():
+		for number, line in lines:
+			current[0] = number
+			yield line
+	reader = csv.reader(trackLines())
+	header = next(reader, None)
+	if header is None:
+		return
+	header = [column.strip() for column in header]
+	if sorted(header) != sorted(TABLE_COLUMNS[table]):
+		raise ValueError("%s: the header must name the columns %s, not %s"
+			% (name, ", ".join(TABLE_COLUMNS[table]), ", ".join(header)))
+	order = [header.index(column) for column in TABLE_COLUMNS[table]]
+	for values in reader:
+		if len(values) != len(header):
+			raise ValueError("%s line %d: expected %d values, found %d"
+				% (name, current[0], len(header), len(values)))
+		yield current[0], [values[index] for index in order]
+
+# Yields (line number, values) for every row of a JSON lines seed file
+def readJSONLines(file, table, name):
+	columns = TABLE_COLUMNS[table]
+	for number, line in numberedLines(file, comments=False):
+		try:
+			row = json.loads(line)
+		except ValueError as error:
+			raise ValueError("%s line %d: %s" % (name, number, error)) from None
+		if isinstance(row, dict):
+			unknown = set(row) - set(columns)
+			if unknown:
+				raise ValueError("%s line %d: unknown columns %s" % (name, number, ", ".join(sorted(unknown))))
+			row = [row.get(column) for column in columns]
+		elif not isinstance(row, list) or len(row) != len(columns):
+			raise ValueError("%s line %d: expected a list of %d values or an object"
+				% (name, number, len(columns)))
+		yield number, row
+
+# Reads one seed file and yields its rows as tuples ready for the loader,
+# with every value checked against COLUMN_TYPES. "required" is the set of
+# columns that may not be empty (see requiredColumns).
+def readSeedFile(path, table, required=()):
+	name = os.path.basename(path)
+	read = readJSONLines if path.endswith(".jsonl") else readCSV
+	columns = TABLE_COLUMNS[table]
+	kinds = COLUMN_TYPES[table]
+	with open(path, newline="", encoding="utf-8") as file:
+		for number, values in read(file, table, name):
+			where = "%s line %d" % (name, number)
+			yield tuple(convertValue(value, kind, column, required, where)
+				for value, kind, column in zip(values, kinds, columns))
+
+# Returns the seed file of a table in "directory", or None if it has none
+def seedFile(directory, table):
+	for extension in SEED_FORMATS:
+		path = os.path.join(directory, table + extension)
+		if os.path.exists(path):
+			return path
+	return None
+
+# Yields "rows", first recording "path" in "reading", so that an error
+# raised while the rows are written can name their file
+def trackedRows(rows, path, reading):
+	reading.append(path)
+	yield from rows
+
+# Loads every seed file in "directory" with ONE call to "load" (syncTables
+# by default, or bulkLoad for an empty database), so the import is one
+# transaction: a bad value anywhere rolls the whole import back.
+# Tables without a file are left alone. A row that breaks a key or names a
+# row no table has raises ValueError with the file's path.
+# Returns the number of rows written per table.
+def importSeedFiles(connect, directory=SEED_DIRECTORY, chunkSize=1000, load=syncTables):
+	tables = {}
+	reading = []
+	for table in SEED_ORDER:
+		path = seedFile(directory, table)
+		if path is not None:
+			tables[table] = trackedRows(readSeedFile(path, table, requiredColumns(connect, table)), path, reading)
+	if not tables:
+		raise ValueError("no seed files found in %s" % directory)
+	try:
+		return load(connect, tables, chunkSize=chunkSize)
+	except sqlite3.IntegrityError as error:
+		raise ValueError("%s: %s" % (reading[-1], error)) from None
@@ -0,0 +1,135 @@
+import contextlib
+import itertools
+import sqlite3
+
+from .cache import queryCache
+from .statements import INSERT_STATEMENTS, UPSERT_STATEMENTS
+
+# DATA CREATION METHODS
+def createWeapon(connect, weapon):
+	cursor = connect.cursor()
+	cursor.execute(INSERT_STATEMENTS["Weapon"], weapon)
+	connect.commit()
+	queryCache.invalidate("Weapon")
+	return cursor.lastrowid
+def createType(connect, type):
+	cursor = connect.cursor()
+	cursor.execute(INSERT_STATEMENTS["Type"], type)
+	connect.commit()
+	queryCache.invalidate("Type")
+	return cursor.lastrowid
+def createMaterial(connect, material):
+	cursor = connect.cursor()
+	cursor.execute(INSERT_STATEMENTS["Material"], material)
+	connect.commit()
+	queryCache.invalidate("Material")
+	return cursor.lastrowid
+def createForgeability(connect, forgeability):
+	cursor = connect.cursor()
+	cursor.execute(INSERT_STATEMENTS["Forgeability"], forgeability)
+	connect.commit()
+	queryCache.invalidate("Forgeability")
+	return cursor.lastrowid
+def createEnchanting(connect, enchanting):
+	cursor = connect.cursor()
+	cursor.execute(INSERT_STATEMENTS["Enchanting"], enchanting)
+	connect.commit()
+	queryCache.invalidate("Enchanting")
+	return cursor.lastrowid
+def createEnchantedWith(connect, enchantedwith):
+	cursor = connect.cursor()
+	cursor.execute(INSERT_STATEMENTS["EnchantedWith"], enchantedwith)
+	connect.commit()
+	queryCache.invalidate("EnchantedWith")
+	return cursor.lastrowid
+
+# BULK DATA CREATION
+# Splits any iterable of rows into lists of at most "size" rows,
+# so even a generator of millions of rows is never fully held in memory
+def chunked(rows, size):
+	rows = iter(rows)
+	chunk = list(itertools.islice(rows, size))
+	while chunk:
+		yield chunk
+		chunk = list(itertools.islice(rows, size))
+
+# TRANSACTIONS
+# Runs the body of a "with" block in ONE transaction and yields a cursor:
+#	with transaction(connect, counts) as cursor:
+#		...
+# If no transaction is open, one is begun, then committed when the block
+# ends or rolled back if it raises. If the caller already has one open
+# (e.g. in ConnectionPool.writing()), the block runs in a SAVEPOINT instead:
+# an error only undoes the block, and committing or rolling back the whole
+# transaction is left to the caller.
+# Either way, the cached results of every table in "tables" are dropped
+# afterwards. It is read when the block ends, so a block can add the tables
+# it wrote to as it goes (e.g. a dict of row counts per table).
+@contextlib.contextmanager
+def transaction(connect, tables=()):
+	cursor = connect.cursor()
+	nested = connect.in_transaction
+	cursor.execute("SAVEPOINT nested_transaction" if nested else "BEGIN")
+	try:
+		yield cursor
+		if nested:
+			cursor.execute("RELEASE nested_transaction")
+		else:
+			connect.commit()
+	except BaseException:
+		if nested:
+			cursor.execute("ROLLBACK TO nested_transaction")
+			cursor.execute("RELEASE nested_transaction")
+		else:
+			connect.rollback()
+		raise
+	finally:
+		for table in tables:
+			queryCache.invalidate(table)
+
+# Inserts many rows at once. "tables" maps a table name to an iterable of
+# row tuples (the same tuples the create methods take). Every row is written
+# with executemany inside ONE transaction, so the whole load costs a single
+# commit instead of one commit per row.
+# With savepoints=True every chunk gets its own SAVEPOINT: a chunk that breaks
+# a constraint (e.g. a duplicate weapon ID) is rolled back and skipped while the
+# rest of the load is kept. Without savepoints any error rolls back everything.
+# Returns the number of rows inserted per table.
+def bulkLoad(connect, tables, chunkSize=1000, savepoints=False):
+	counts = {}
+	with transaction(connect, counts) as cursor:
+		for table, rows in tables.items():
+			SQL = INSERT_STATEMENTS[table]
+			counts[table] = 0
+			for chunk in chunked(rows, chunkSize):
+				if savepoints:
+					cursor.execute("SAVEPOINT bulk_chunk")
+					try:
+						cursor.executemany(SQL, chunk)
+					except sqlite3.IntegrityError:
+						cursor.execute("ROLLBACK TO bulk_chunk")
+						cursor.execute("RELEASE bulk_chunk")
+						continue
+					cursor.execute("RELEASE bulk_chunk")
+				else:
+					cursor.executemany(SQL, chunk)
+				counts[table] += len(chunk)
+	return counts
+
+# IDEMPOTENT DATA CREATION
+# Inserts or updates many rows at once, in ONE transaction, so the seed data
+# can be applied to a database that already holds it. "tables" has the same
+# shape as for bulkLoad. Rows that already exist with the same values are not
+# touched, which makes running the script again almost free.
+# Returns the number of rows actually inserted or updated per table.
+def syncTables(connect, tables, chunkSize=1000):
+	counts = {}
+	with transaction(connect, counts) as cursor:
+		for table, rows in tables.items():
+			SQL = UPSERT_STATEMENTS[table]
+			counts[table] = 0
+			for chunk in chunked(rows, chunkSize):
+				cursor.executemany(SQL, chunk)
+				# rowcount leaves out the WeaponStats rows written by triggers
+				counts[table] += cursor.rowcount
+	return counts
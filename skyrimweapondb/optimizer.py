@@ -0,0 +1,146 @@
+# LOADOUT OPTIMIZER
+# Answers "what are the k best weapons I can forge at level L, with these
+# perks, that weigh at most W" without a query per question. Every weapon
+# is read ONCE from the WeaponStats table, scored, and its position sorted
+# by each score into compact arrays. A question then walks the weapons
+# from best to worst and stops at the k-th one that passes its
+# constraints, so it only touches a short prefix of a big catalog.
+# The scores are:
+#	damage   the material's damage
+#	dps      damage times speed: the type's swing speed, or the material's
+#	         draw speed for bows, which have no type speed
+#	value    value per unit of weight
+# A weapon can take any enchantment made for its type (Enchanting.Weapon),
+# and enchantments do not change a weapon's score, so the (weapon,
+# enchantment) combinations are listed weapon by weapon as they are needed
+# instead of being built up front.
+import array
+import collections
+import math
+import threading
+
+from .cache import queryCache
+from .schema import TABLE_COLUMNS
+
+# The weapons the optimizer chooses from, with the speed DPS is scored by
+CANDIDATES_SQL = '''SELECT ID, Name, Type, Material, Weight, Damage, Value,
+	COALESCE(TypeSpeed, MaterialSpeed, 1.0), Forgeability, ForgeLevel
+	FROM WeaponStats WHERE Damage IS NOT NULL'''
+ENCHANTMENTS_SQL = "SELECT Weapon, Name FROM Enchanting ORDER BY Name"
+# WeaponStats changes whenever any base table does, through its triggers
+CANDIDATE_TABLES = ("WeaponStats",) + tuple(TABLE_COLUMNS)
+
+SCORES = ("damage", "dps", "value")
+HANDEDNESS = ("One-Handed", "Two-Handed", "Archery")
+
+# One answer: a weapon, its score and, with enchanted=True, an enchantment
+Loadout = collections.namedtuple("Loadout",
+	"ID Name Type Material Weight Damage Value Speed Forgeability ForgeLevel Score Enchantment")
+
+# Returns the handedness of a weapon type. Types are named after it
+# ("One-Handed Sword"), and everything else is a bow.
+def handedness(type):
+	for hands in HANDEDNESS[:2]:
+		if type.startswith(hands):
+			return hands
+	return "Archery"
+
+# Returns a candidate row's value for every score, in SCORES order
+def scoreRow(row):
+	weight, damage, value, speed = row[4], row[5], row[6], row[7]
+	return (float(damage), damage * speed, value / weight if weight else math.inf)
+
+class LoadoutOptimizer:
+	def __init__(self, connect):
+		self.connect = connect
+		self.rows = None
+
+	# Reads the weapons again and rebuilds the sorted orders, but only when
+	# they changed: the rows come from the read cache, which hands out the
+	# same tuple until a write to one of the tables invalidates it
+	def refresh(self):
+		rows = queryCache.fetch(self.connect, CANDIDATES_SQL, (), CANDIDATE_TABLES)
+		if rows is self.rows:
+			return
+		self.scores = [scoreRow(row) for row in rows]
+		self.hands = [handedness(row[2]) for row in rows]
+		# orders[score][hands] lists row positions, best score first; the
+		# None entry holds every row
+		self.orders = {}
+		for index, score in enumerate(SCORES):
+			order = sorted(range(len(rows)), key=lambda position: -self.scores[position][index])
+			self.orders[score] = {None: array.array("l", order)}
+			for hands in HANDEDNESS:
+				self.orders[score][hands] = array.array("l", (position for position in order if self.hands[position] == hands))
+		self.enchantments = collections.defaultdict(list)
+		for type, name in queryCache.fetch(self.connect, ENCHANTMENTS_SQL, (), ("Enchanting",)):
+			self.enchantments[type].append(name)
+		self.rows = rows
+
+	# Returns the k best weapons (or, with enchanted=True, the k best
+	# (weapon, enchantment) combinations) by "score", as Loadouts.
+	# Every constraint is optional:
+	#	level      the player's smithing level: weapons whose perk needs a
+	#	           higher level are left out
+	#	perks      the perks the player has: weapons that need any other
+	#	           perk are left out
+	#	maxWeight  the most a weapon may weigh
+	#	hands      one of HANDEDNESS
+	# Raises ValueError for an unknown score or handedness.
+	def best(self, k=5, score="damage", level=None, perks=None, maxWeight=None, hands=None, enchanted=False):
+		if score not in SCORES:
+			raise ValueError("unknown score %r, expected one of %s" % (score, ", ".join(SCORES)))
+		if hands is not None and hands not in HANDEDNESS:
+			raise ValueError("unknown handedness %r, expected one of %s" % (hands, ", ".join(HANDEDNESS)))
+		self.refresh()
+		perks = None if perks is None else set(perks)
+		scoreIndex = SCORES.index(score)
+		loadouts = []
+		for position in self.orders[score][hands]:
+			if len(loadouts) >= k:
+				break
+			row = self.rows[position]
+			if maxWeight is not None and row[4] > maxWeight:
+				continue
+			if level is not None and (row[9] or 0) > level:
+				continue
+			if perks is not None and row[8] is not None and row[8] not in perks:
+				continue
+			result = row + (self.scores[position][scoreIndex],)
+			if not enchanted:
+				loadouts.append(Loadout(*result, None))
+				continue
+			for enchantment in self.enchantments.get(row[2]) or [None]:
+				loadouts.append(Loadout(*result, enchantment))
+		return loadouts[:k]
+
+# One optimizer per connection, made on first use. Each one holds a whole
+# catalog, and pools and replicas keep opening new connections, so only the
+# MAX_OPTIMIZERS most recently used are kept.
+MAX_OPTIMIZERS = 4
+optimizers = collections.OrderedDict()
+optimizersLock = threading.Lock()
+
+# Returns the k best loadouts of a connection's catalog (see
+# LoadoutOptimizer.best for the constraints)
+def bestLoadouts(connect, k=5, score="damage", **constraints):
+	with optimizersLock:
+		optimizer = optimizers.get(connect)
+		if optimizer is None:
+			optimizer = optimizers[connect] = LoadoutOptimizer(connect)
+			if len(optimizers) > MAX_OPTIMIZERS:
+				optimizers.popitem(last=False)
+		else:
+			optimizers.move_to_end(connect)
+	return optimizer.best(k, score, **constraints)
+
+# Prints the best loadouts by every score for a player of "level" (or any
+# level, when None)
+def printBestLoadouts(connect, level=None, k=5):
+	for score in SCORES:
+		print("Best %d Weapons By %s%s:" % (k, score.upper() if score == "dps" else score.capitalize(),
+			"" if level is None else " At Level %d" % level))
+		for loadout in bestLoadouts(connect, k, score, level=level):
+			print("%-28s %-18s %6.2f  (%s)" % (loadout.Name, loadout.Type, loadout.Score,
+				loadout.Forgeability or "no perk"))
+		print()
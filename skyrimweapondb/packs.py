@@ -0,0 +1,161 @@
+# PACKS
+# A pack is a DLC or mod that adds materials, weapons and forgeability perks
+# to the game. Its manifest is a directory of seed files (see importer.py),
+# one per table it adds rows to, and the directory's name is the pack's
+# name. The DLCs of the base game are in the "packs" directory.
+# Every row a pack writes has its "Pack" column set to the pack's name, so
+# it can be listed, reloaded or unloaded later without touching the rest of
+# the database.
+import os
+import sqlite3
+
+from .importer import readSeedFile, requiredColumns, seedFile
+from .loader import chunked, transaction
+from .schema import PACK_TABLES, TABLE_COLUMNS, TABLE_KEYS
+
+PACK_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "packs")
+
+# The DLCs build() loads, in order
+BUILTIN_PACKS = ("Dragonborn", "Dawnguard")
+
+# The rows that use a row of a pack table, other than the Weapon rows'
+# enchantments, which go with their weapon ({row} is the table's name)
+PACK_REFERENCES = {
+	"Forgeability": "SELECT 1 FROM Material WHERE Material.Forgeability = {row}.Perk_Name",
+	"Material": "SELECT 1 FROM Weapon WHERE Weapon.Material = {row}.Name AND Weapon.Type = {row}.Type",
+}
+
+# Returns the condition that a row of "table" is not used by any other row
+def unreferenced(table):
+	if table not in PACK_REFERENCES:
+		return "1"
+	return "NOT EXISTS (%s)" % PACK_REFERENCES[table].format(row='"%s"' % table)
+
+# Writes the rows a pack's staging table for "table" holds and returns how
+# many rows were inserted or updated. Fails if the pack would change a row
+# that belongs to the base game or to another pack. A row that another pack
+# or the base game already holds with exactly the same values is left to
+# its owner: the pack only uses it.
+# With "adopt" every row that belongs to no pack is taken over, whatever
+# its values (see loadPack).
+def applyStagedRows(cursor, table, name, adopt=False):
+	columns = TABLE_COLUMNS[table]
+	key = TABLE_KEYS[table]
+	values = [column for column in columns if column not in key]
+	staging = "PackStaging_%s" % table
+	joined = " AND ".join('"%s"."%s" = %s."%s"' % (table, column, staging, column) for column in key)
+	cursor.execute('''SELECT %s FROM %s JOIN "%s" ON %s
+		WHERE "%s".Pack IS NOT :pack AND NOT (:adopt AND "%s".Pack IS NULL) AND (%s) LIMIT 1''' % (
+		", ".join("%s.%s" % (staging, column) for column in key), staging, table, joined, table, table,
+		" OR ".join('"%s"."%s" IS NOT %s."%s"' % (table, column, staging, column) for column in values) or "0"),
+		{"pack": name, "adopt": adopt})
+	conflict = cursor.fetchone()
+	if conflict is not None:
+		raise ValueError("pack %s would change %s %s, which belongs to another pack or the base game"
+			% (name, table, ", ".join(str(value) for value in conflict)))
+
+	# "WHERE true" tells SQLite the ON CONFLICT belongs to the INSERT, not
+	# the SELECT. Only the pack's own rows, and with "adopt" the rows of no
+	# pack, are updated.
+	changed = " OR ".join('"%s"."%s" IS NOT excluded."%s"' % (table, column, column) for column in values) or "0"
+	SQL = 'INSERT INTO "%s" (%s, Pack) SELECT %s, :pack FROM %s WHERE true ON CONFLICT(%s) DO UPDATE SET %s' % (
+		table, ", ".join(columns), ", ".join(columns), staging, ", ".join(key),
+		", ".join("%s = excluded.%s" % (column, column) for column in values + ["Pack"]))
+	SQL += ' WHERE ("%s".Pack IS :pack AND (%s)) OR (:adopt AND "%s".Pack IS NULL)' % (table, changed, table)
+	cursor.execute(SQL, {"pack": name, "adopt": adopt})
+	return cursor.rowcount
+
+# Removes the rows of "table" that a reloaded pack no longer lists and
+# returns how many it removed. Rows another pack's or the base game's rows
+# still use are kept, and stay the pack's.
+def removeStaleRows(cursor, table, name):
+	staging = "PackStaging_%s" % table
+	joined = " AND ".join('"%s"."%s" = %s."%s"' % (table, column, staging, column) for column in TABLE_KEYS[table])
+	cursor.execute('DELETE FROM "%s" WHERE Pack = :pack AND NOT EXISTS (SELECT 1 FROM %s WHERE %s) AND %s'
+		% (table, staging, joined, unreferenced(table)), {"pack": name})
+	return cursor.rowcount
+
+# Loads a pack, in ONE transaction: either every row of the pack is written
+# or, if anything fails, none is. "tables" maps a table of PACK_TABLES to an
+# iterable of row tuples, like bulkLoad takes. Loading a pack that is
+# already loaded only writes the rows that changed, and removes the rows
+# the pack no longer has, once the rows that used them are gone.
+# "adopt" lets the pack take over rows that belong to no pack even when it
+# changes them. build() uses it for the DLCs, whose rows databases made
+# before packs existed already hold without a "Pack".
+# A row that names a row no table has raises ValueError.
+# Returns the number of rows written per table.
+def loadPack(connect, name, tables, chunkSize=1000, adopt=False):
+	unknown = set(tables) - set(PACK_TABLES)
+	if unknown:
+		raise ValueError("packs can only add rows to %s, not %s" % (", ".join(PACK_TABLES), ", ".join(sorted(unknown))))
+	counts = {}
+	loaded = [table for table in PACK_TABLES if table in tables]
+	# Rolling back also drops the staging tables
+	with transaction(connect, counts) as cursor:
+		for table in loaded:
+			# The rows are staged in a temporary table first, so checking
+			# them and writing them are each one set-based statement
+			staging = "PackStaging_%s" % table
+			cursor.execute('CREATE TEMP TABLE %s AS SELECT %s FROM "%s" WHERE 0'
+				% (staging, ", ".join(TABLE_COLUMNS[table]), table))
+			cursor.execute("CREATE INDEX temp.%s_Key ON %s(%s)" % (staging, staging, ", ".join(TABLE_KEYS[table])))
+			SQL = "INSERT INTO %s VALUES (%s)" % (staging, ", ".join("?" * len(TABLE_COLUMNS[table])))
+			for chunk in chunked(tables[table], chunkSize):
+				cursor.executemany(SQL, chunk)
+			try:
+				counts[table] = applyStagedRows(cursor, table, name, adopt)
+			except sqlite3.IntegrityError as error:
+				raise ValueError("pack %s: %s rows: %s" % (name, table, error)) from None
+		# Weapons go first, then the materials and perks they used
+		for table in reversed(loaded):
+			counts[table] += removeStaleRows(cursor, table, name)
+		for table in loaded:
+			cursor.execute("DROP TABLE temp.PackStaging_%s" % table)
+	return counts
+
+# Loads the pack whose seed files are in "directory". The pack is named
+# after the directory unless "name" is given.
+def loadPackDirectory(connect, directory, name=None, chunkSize=1000, adopt=False):
+	name = name or os.path.basename(os.path.normpath(directory))
+	tables = {}
+	for table in PACK_TABLES:
+		path = seedFile(directory, table)
+		if path is not None:
+			tables[table] = readSeedFile(path, table, requiredColumns(connect, table))
+	if not tables:
+		raise ValueError("no seed files found in %s" % directory)
+	return loadPack(connect, name, tables, chunkSize, adopt)
+
+# Removes every row a pack added, with one indexed DELETE per table, in ONE
+# transaction. Weapons go first, then the materials and perks they used.
+# Rows that another pack's or the base game's rows still use are kept, and
+# stay the pack's until those are removed too.
+# Returns the number of rows removed per table.
+def unloadPack(connect, name):
+	counts = {}
+	with transaction(connect, counts) as cursor:
+		for table in reversed(PACK_TABLES):
+			cursor.execute('DELETE FROM "%s" WHERE Pack = ? AND %s' % (table, unreferenced(table)), (name,))
+			counts[table] = cursor.rowcount
+	return counts
+
+# Returns the loaded packs, as {pack: {table: row count}}
+def listPacks(connect):
+	packs = {}
+	cursor = connect.cursor()
+	for table in PACK_TABLES:
+		cursor.execute('SELECT Pack, COUNT(*) FROM "%s" WHERE Pack IS NOT NULL GROUP BY Pack' % table)
+		for pack, count in cursor.fetchall():
+			packs.setdefault(pack, {})[table] = count
+	return packs
+
+# Adding the weaponry and associated material and forgeability perk
+# from the Dragonborn DLC.
+def addDragonbornDLC(connect):
+	return loadPackDirectory(connect, os.path.join(PACK_DIRECTORY, "Dragonborn"), adopt=True)
+
+# Adding the weaponry and associated material and forgeability perk
+# from the Dawnguard DLC.
+def addDawngaurdDLC(connect):
+	return loadPackDirectory(connect, os.path.join(PACK_DIRECTORY, "Dawnguard"), adopt=True)
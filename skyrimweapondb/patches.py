@@ -0,0 +1,133 @@
+# PATCHES
+# A patch is a list of declarative changes, like the fixes of the Unofficial
+# Skyrim Patch: "set these columns of the row with this key to these
+# values". applyPatch writes a whole patch in ONE transaction and checks
+# every change, so a patch is either applied completely or not at all.
+# A patch file is a JSON lines file with one change per line:
+#	{"table": "Material", "key": ["Ebony", "One-Handed Axe"],
+#	 "set": {"Damage": 14}, "expect": {"Damage": 15}}
+# "key" holds the values of the table's TABLE_KEYS columns and "expect" is
+# optional.
+import collections
+import json
+
+from .importer import convertValue
+from .loader import chunked, transaction
+from .schema import COLUMN_TYPES, TABLE_COLUMNS, TABLE_KEYS
+from .statements import updateSQL
+
+# The most columns any table's key has, i.e. the width of the temporary
+# table the keys of a patch are staged in
+KEY_WIDTH = max(len(key) for key in TABLE_KEYS.values())
+
+# One change of a patch. "values" maps a column to its new value and
+# "expected", if given, maps a column to the value it must hold before the
+# patch is applied.
+Change = collections.namedtuple("Change", "table key values expected", defaults=(None,))
+
+# Checks that a change names a table, a full key and columns that exist.
+# Raises ValueError when it doesn't.
+def checkChange(change):
+	if change.table not in TABLE_KEYS:
+		raise ValueError("unknown table %r" % (change.table,))
+	if len(change.key) != len(TABLE_KEYS[change.table]):
+		raise ValueError("a %s key has %d values (%s), not %d" % (change.table, len(TABLE_KEYS[change.table]),
+			", ".join(TABLE_KEYS[change.table]), len(change.key)))
+	if not change.values:
+		raise ValueError("the change of %s %s sets no columns" % (change.table, change.key))
+	for column in list(change.values) + list(change.expected or ()):
+		if column not in TABLE_COLUMNS[change.table] or column in TABLE_KEYS[change.table]:
+			raise ValueError("%s has no column %r that a patch can set" % (change.table, column))
+
+# Returns {key: row} for the rows of "table" whose keys are in "keys", with
+# ONE query: the keys are staged in a temporary table and joined against.
+# Rows are in TABLE_COLUMNS order.
+def fetchRows(cursor, table, keys):
+	key = TABLE_KEYS[table]
+	columns = TABLE_COLUMNS[table]
+	cursor.execute("DELETE FROM PatchKeys")
+	for chunk in chunked(keys, 1000):
+		cursor.executemany("INSERT INTO PatchKeys VALUES (%s)" % ", ".join("?" * KEY_WIDTH),
+			[keyValues + (None,) * (KEY_WIDTH - len(keyValues)) for keyValues in chunk])
+	cursor.execute('SELECT %s FROM "%s" JOIN PatchKeys ON %s' % (
+		", ".join('"%s"."%s"' % (table, column) for column in columns), table,
+		" AND ".join('"%s"."%s" = PatchKeys.Key%d' % (table, column, index) for index, column in enumerate(key))))
+	positions = [columns.index(column) for column in key]
+	return {tuple(row[position] for position in positions): row for row in cursor.fetchall()}
+
+# Applies every change of a patch in ONE transaction. For each table the
+# rows are read once before and once after all its updates, and the patch
+# is rolled back with a ValueError if:
+#	- a change's key matches no row,
+#	- a row does not hold a change's "expected" values,
+#	- a row does not hold a change's new values afterwards (e.g. because
+#	  a later change of the same patch set the column again).
+# Returns the diff: one (change, before, after) tuple per change, in the
+# order of "changes", where before and after are the row in TABLE_COLUMNS
+# order.
+def applyPatch(connect, changes):
+	changes = [change if isinstance(change, Change) else Change(*change) for change in changes]
+	byTable = collections.defaultdict(list)
+	for change in changes:
+		checkChange(change)
+		byTable[change.table].append(change)
+
+	befores = {}
+	afters = {}
+	# Rolling back also drops the temporary table
+	with transaction(connect, afters) as cursor:
+		keyColumns = ", ".join("Key%d" % index for index in range(KEY_WIDTH))
+		cursor.execute("CREATE TEMP TABLE IF NOT EXISTS PatchKeys (%s, PRIMARY KEY (%s))" % (keyColumns, keyColumns))
+		for table, tableChanges in byTable.items():
+			columns = TABLE_COLUMNS[table]
+			keys = list(dict.fromkeys(tuple(change.key) for change in tableChanges))
+			before = befores[table] = fetchRows(cursor, table, keys)
+			for change in tableChanges:
+				row = before.get(tuple(change.key))
+				if row is None:
+					raise ValueError("%s %s does not exist" % (table, ", ".join(map(str, change.key))))
+				for column, value in (change.expected or {}).items():
+					if row[columns.index(column)] != value:
+						raise ValueError("%s %s has %s = %r, not the expected %r" % (table,
+							", ".join(map(str, change.key)), column, row[columns.index(column)], value))
+
+			# Changes that set the same columns share one executemany
+			updates = collections.defaultdict(list)
+			for change in tableChanges:
+				setColumns = tuple(change.values)
+				updates[setColumns].append(tuple(change.values[column] for column in setColumns) + tuple(change.key))
+			for setColumns, parameters in updates.items():
+				cursor.executemany(updateSQL(table, setColumns), parameters)
+
+			after = afters[table] = fetchRows(cursor, table, keys)
+			for change in tableChanges:
+				row = after.get(tuple(change.key))
+				for column, value in change.values.items():
+					if row is None or row[columns.index(column)] != value:
+						raise ValueError("%s %s did not end up with %s = %r" % (table,
+							", ".join(map(str, change.key)), column, value))
+		cursor.execute("DROP TABLE temp.PatchKeys")
+	return [(change, befores[change.table][tuple(change.key)], afters[change.table][tuple(change.key)])
+		for change in changes]
+
+# Reads a patch file (see above) one line at a time and yields its changes,
+# with every value checked against COLUMN_TYPES
+def readPatchFile(path):
+	with open(path, encoding="utf-8") as file:
+		for number, line in enumerate(file, 1):
+			if not line.strip():
+				continue
+			where = "%s line %d" % (path, number)
+			try:
+				entry = json.loads(line)
+				table = entry["table"]
+				kinds = dict(zip(TABLE_COLUMNS[table], COLUMN_TYPES[table]))
+				def convert(column, value):
+					return convertValue(value, kinds[column], column, (), where)
+				change = Change(table,
+					tuple(convert(column, value) for column, value in zip(TABLE_KEYS[table], entry["key"])),
+					{column: convert(column, value) for column, value in entry["set"].items()},
+					{column: convert(column, value) for column, value in entry.get("expect", {}).items()} or None)
+			except (KeyError, TypeError, json.JSONDecodeError) as error:
+				raise ValueError("%s: not a valid change (%s)" % (where, error)) from None
+			yield change
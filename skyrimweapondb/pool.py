@@ -0,0 +1,95 @@
+import contextlib
+import threading
+
+from . import connection
+from .cache import queryCache
+
+# CONNECTION POOL
+# One module-wide connection serializes every thread, and sqlite3 refuses to
+# share a connection between threads by default. The pool instead gives each
+# thread its own read-only connection and keeps a single writer connection
+# behind a lock. The database runs in WAL mode, so readers never wait for
+# the writer and the writer never waits for readers.
+
+# The settings every pooled connection is opened with
+PRAGMAS = {
+	"journal_mode": "WAL",
+	"synchronous": "NORMAL",
+	"cache_size": -16000,
+	"mmap_size": 268435456,
+	"busy_timeout": 5000,
+	"foreign_keys": "ON",
+}
+
+# Applies PRAGMAS to a connection. Read connections also get query_only,
+# so a write through them fails instead of fighting the writer for the lock.
+def configureConnection(connect, pragmas=PRAGMAS, readOnly=False):
+	cursor = connect.cursor()
+	for name, value in pragmas.items():
+		cursor.execute("PRAGMA %s = %s" % (name, value))
+	if readOnly:
+		cursor.execute("PRAGMA query_only = ON")
+	return connect
+
+class ConnectionPool:
+	def __init__(self, database=None, pragmas=PRAGMAS):
+		self.database = database or connection.DATABASE
+		self.pragmas = pragmas
+		self.local = threading.local()
+		self.readers = []
+		self.readersLock = threading.Lock()
+		self.writeLock = threading.RLock()
+		self.writer = None
+
+	# Returns the calling thread's read connection, opening it on first use
+	def reader(self):
+		connect = getattr(self.local, "connect", None)
+		if connect is None:
+			# check_same_thread is off only so close() can close it from
+			# another thread; it is never handed to any other thread.
+			connect = connection.openConnection(self.database, check_same_thread=False)
+			connect = configureConnection(connect, self.pragmas, readOnly=True)
+			self.local.connect = connect
+			with self.readersLock:
+				self.readers.append(connect)
+		return connect
+
+	# Hands out the single writer connection to one thread at a time:
+	#	with pool.writing() as connect:
+	#		...
+	# The transaction is committed when the block ends (rolled back if it
+	# raises), and then the cached results of "tables" are dropped, or the
+	# whole read cache when no tables are given.
+	@contextlib.contextmanager
+	def writing(self, tables=None):
+		with self.writeLock:
+			if self.writer is None:
+				self.writer = configureConnection(
+					connection.openConnection(self.database, check_same_thread=False), self.pragmas)
+			try:
+				yield self.writer
+				self.writer.commit()
+			except BaseException:
+				self.writer.rollback()
+				raise
+			finally:
+				if tables is None:
+					queryCache.clear()
+				else:
+					for table in tables:
+						queryCache.invalidate(table)
+
+	# Closes every connection. Read connections belong to their threads, so
+	# this should only be called once those threads are done.
+	def close(self):
+		with self.readersLock:
+			for connect in self.readers:
+				queryCache.forget(connect)
+				connect.close()
+			self.readers = []
+		self.local = threading.local()
+		with self.writeLock:
+			if self.writer is not None:
+				queryCache.forget(self.writer)
+				self.writer.close()
+				self.writer = None
@@ -0,0 +1,196 @@
+# PROFILER
+# Records how long every statement takes. A connection opened with
+# factory=ProfiledConnection (see connection.setProfiling) hands out
+# ProfiledCursors, which time each statement from its execute() until its
+# last row is fetched and report it to a QueryProfiler:
+#	- a latency histogram, call count, total and worst time,
+#	- the number of rows returned (or changed, for writes),
+#	- an estimate of the rows scanned: SQLite calls the connection's
+#	  progress handler every STEP_INTERVAL virtual machine instructions,
+#	  and a statement that reads more rows runs more instructions.
+# Statements are grouped by their SQL text. Any statement slower than the
+# profiler's slow threshold is also logged as a warning.
+import bisect
+import sqlite3
+import threading
+import time
+
+# How many virtual machine instructions each progress handler call stands for
+STEP_INTERVAL = 100
+
+# The upper bounds, in seconds, of the latency histogram's buckets. The last
+# bucket holds everything slower.
+HISTOGRAM_BOUNDS = (0.0001, 0.001, 0.01, 0.1, 1.0)
+HISTOGRAM_LABELS = ("<0.1ms", "<1ms", "<10ms", "<100ms", "<1s", ">=1s")
+
+class QueryProfiler:
+	def __init__(self, slowThreshold=None):
+		# Statements slower than this many seconds are logged (None: never)
+		self.slowThreshold = slowThreshold
+		self.lock = threading.Lock()
+		self.statements = {}
+
+	# Adds one finished statement
+	def record(self, SQL, seconds, rows, steps):
+		SQL = " ".join(SQL.split())
+		with self.lock:
+			entry = self.statements.get(SQL)
+			if entry is None:
+				entry = self.statements[SQL] = {"calls": 0, "totalSeconds": 0.0, "maxSeconds": 0.0,
+					"rows": 0, "stepsScanned": 0, "histogram": [0] * len(HISTOGRAM_LABELS)}
+			entry["calls"] += 1
+			entry["totalSeconds"] += seconds
+			entry["maxSeconds"] = max(entry["maxSeconds"], seconds)
+			entry["rows"] += rows
+			entry["stepsScanned"] += steps * STEP_INTERVAL
+			entry["histogram"][bisect.bisect_right(HISTOGRAM_BOUNDS, seconds)] += 1
+		if self.slowThreshold is not None and seconds >= self.slowThreshold:
+			# Imported here, so importing the package doesn't load logging
+			import logging
+			logging.getLogger(__name__).warning("slow query (%.1f ms, %d rows): %s", seconds * 1000, rows, SQL)
+
+	# Returns a copy of the statistics, as {SQL: statistics}, slowest total first
+	def snapshot(self):
+		with self.lock:
+			statements = sorted(self.statements.items(), key=lambda item: -item[1]["totalSeconds"])
+			return {SQL: dict(entry, meanSeconds=entry["totalSeconds"] / entry["calls"],
+				histogram=dict(zip(HISTOGRAM_LABELS, entry["histogram"]))) for SQL, entry in statements}
+
+	def reset(self):
+		with self.lock:
+			self.statements.clear()
+
+	# Prints the snapshot as a table, slowest total first
+	def dump(self, limit=None):
+		snapshot = list(self.snapshot().items())[:limit]
+		print("%6s %10s %10s %10s %8s %10s  %s" % ("calls", "total ms", "mean ms", "max ms", "rows", "scanned", "statement"))
+		for SQL, entry in snapshot:
+			print("%6d %10.3f %10.3f %10.3f %8d %10d  %s" % (entry["calls"], entry["totalSeconds"] * 1000,
+				entry["meanSeconds"] * 1000, entry["maxSeconds"] * 1000, entry["rows"], entry["stepsScanned"],
+				SQL if len(SQL) <= 100 else SQL[:97] + "..."))
+			print("%48s  %s" % ("", "  ".join("%s: %d" % item for item in entry["histogram"].items() if item[1])))
+
+profiler = QueryProfiler()
+
+# A cursor that reports each of its statements to the connection's profiler.
+# A statement is open from execute() until its rows run out, the next
+# execute() or close(); its time is the time spent inside those calls.
+class ProfiledCursor(sqlite3.Cursor):
+	def __init__(self, connect):
+		super().__init__(connect)
+		self.profiled = None
+
+	# Runs one call of the open statement, adding its time and steps
+	def measure(self, call, *args):
+		connect = self.connection
+		steps = connect.steps
+		start = time.perf_counter()
+		try:
+			return call(*args)
+		finally:
+			if self.profiled is not None:
+				self.profiled[1] += time.perf_counter() - start
+				self.profiled[3] += connect.steps - steps
+
+	def begin(self, SQL):
+		self.finish()
+		self.profiled = [SQL, 0.0, 0, 0]
+
+	# Reports the open statement, if any, to the profiler
+	def finish(self):
+		if self.profiled is not None:
+			SQL, seconds, rows, steps = self.profiled
+			self.profiled = None
+			if self.rowcount > 0 and not rows:
+				rows = self.rowcount
+			self.connection.profiler.record(SQL, seconds, rows, steps)
+
+	def execute(self, SQL, parameters=()):
+		self.begin(SQL)
+		try:
+			self.measure(super().execute, SQL, parameters)
+		finally:
+			# Statements without rows (and failed ones) are done already
+			if self.description is None:
+				self.finish()
+		return self
+
+	def executemany(self, SQL, parameters):
+		self.begin(SQL)
+		try:
+			self.measure(super().executemany, SQL, parameters)
+		finally:
+			self.finish()
+		return self
+
+	def executescript(self, script):
+		self.begin(script)
+		try:
+			self.measure(super().executescript, script)
+		finally:
+			self.finish()
+		return self
+
+	def fetchone(self):
+		row = self.measure(super().fetchone)
+		if row is None:
+			self.finish()
+		elif self.profiled is not None:
+			self.profiled[2] += 1
+		return row
+
+	def fetchmany(self, size=None):
+		rows = self.measure(super().fetchmany, self.arraysize if size is None else size)
+		if self.profiled is not None:
+			self.profiled[2] += len(rows)
+			if len(rows) < (self.arraysize if size is None else size):
+				self.finish()
+		return rows
+
+	def fetchall(self):
+		rows = self.measure(super().fetchall)
+		if self.profiled is not None:
+			self.profiled[2] += len(rows)
+		self.finish()
+		return rows
+
+	def __next__(self):
+		row = self.fetchone()
+		if row is None:
+			raise StopIteration
+		return row
+
+	def close(self):
+		self.finish()
+		super().close()
+
+	# A statement whose rows were never all fetched is reported when its
+	# cursor goes away
+	def __del__(self):
+		self.finish()
+
+# A connection whose cursors, and whose execute shortcuts, are profiled.
+# "steps" counts the progress handler calls of all its statements.
+class ProfiledConnection(sqlite3.Connection):
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args, **kwargs)
+		self.profiler = profiler
+		self.steps = 0
+		self.set_progress_handler(self.step, STEP_INTERVAL)
+
+	def step(self):
+		self.steps += 1
+		# Returning anything true would interrupt the statement
+		return 0
+
+	def cursor(self, factory=ProfiledCursor):
+		return super().cursor(factory)
+
+	def execute(self, SQL, parameters=()):
+		return self.cursor().execute(SQL, parameters)
+
+	def executemany(self, SQL, parameters):
+		return self.cursor().executemany(SQL, parameters)
+
+	def executescript(self, script):
+		return self.cursor().executescript(script)
@@ -0,0 +1,242 @@
+# QUERIES
+import collections
+
+from .cache import queryCache
+from .schema import TABLE_COLUMNS
+
+# Every statement run by the query functions below. The audit in audit.py
+# checks that each of them is answered through an index.
+# Values are always "?" parameters, never literals in the SQL, so asking for
+# another material or level reuses the statement sqlite3 already compiled.
+QUERIES = {
+	"weaponsByMaterial": "SELECT Name FROM Weapon WHERE Material = ?",
+	"weaponsByMaterialAndType": "SELECT Name FROM Weapon WHERE Material = ? AND Type = ?",
+	"materialsBySpeed": "SELECT Name FROM Material WHERE Speed >= ?",
+	"materialsOfTypeBySpeed": "SELECT Name FROM Material WHERE Type = ? AND Speed >= ?",
+	"enchantedWeapons": "SELECT * FROM EnchantedWith",
+	"perksAboveLevel": "SELECT Perk_Name FROM Forgeability WHERE Level > ?",
+	"enchantmentsForType": "SELECT Name, Effect FROM Enchanting WHERE Weapon = ?",
+	"damageAbove": "SELECT Damage, Weight, Name FROM Material WHERE Damage > ?",
+	"weaponStats": "SELECT * FROM ResolvedWeapon WHERE ID = ?",
+	"weaponStatSheet": "SELECT * FROM WeaponStats WHERE ID = ?",
+}
+# The parameters the original script ran each query with, also used by
+# the audit and the benchmarks
+QUERY_EXAMPLES = {
+	"weaponsByMaterial": ("Iron",),
+	"weaponsByMaterialAndType": ("Dwarven", "One-Handed Axe"),
+	"materialsBySpeed": (0.75,),
+	"materialsOfTypeBySpeed": ("Bow", 0.5),
+	"enchantedWeapons": (),
+	"perksAboveLevel": (20,),
+	"enchantmentsForType": ("Two-Handed Mace",),
+	"damageAbove": (13,),
+	"weaponStats": ("000139ab",),
+	"weaponStatSheet": ("00012eb7",),
+}
+# The tables each query reads, so cached results can be invalidated.
+# WeaponStats changes whenever any base table does, through its triggers.
+QUERY_TABLES = {
+	"weaponsByMaterial": ("Weapon",),
+	"weaponsByMaterialAndType": ("Weapon",),
+	"materialsBySpeed": ("Material",),
+	"materialsOfTypeBySpeed": ("Material",),
+	"enchantedWeapons": ("EnchantedWith",),
+	"perksAboveLevel": ("Forgeability",),
+	"enchantmentsForType": ("Enchanting",),
+	"damageAbove": ("Material",),
+	"weaponStats": ("Weapon", "Material"),
+	"weaponStatSheet": ("WeaponStats",) + tuple(TABLE_COLUMNS),
+}
+# Queries that list a whole table on purpose and so may SCAN it
+FULL_SCAN_QUERIES = {"enchantedWeapons"}
+
+# Runs one of the registered QUERIES through the read cache
+def runQuery(connect, name, params=()):
+	return queryCache.fetch(connect, QUERIES[name], params, QUERY_TABLES[name])
+
+# OUTPUT
+# Prints a titled list of rows followed by a blank line. The query functions
+# below only call this when "display" is set; they always return their rows.
+def printRows(title, rows):
+	if title is not None:
+		print(title)
+	for row in rows:
+		print(row)
+	print()
+
+# Returns the names of all weapons of a material, or only those of one
+# weapon type when "type" is given
+def selectWeaponsByMaterial(connect, material, type=None, display=True):
+	if type is None:
+		rows = runQuery(connect, "weaponsByMaterial", (material,))
+	else:
+		rows = runQuery(connect, "weaponsByMaterialAndType", (material, type))
+	if display:
+		printRows("List Of All %s %s:" % (material, type + "s" if type else "Weapons"), rows)
+	return rows
+
+# Returns the names of all materials with a speed of at least "minSpeed",
+# or only those of one weapon type (e.g. "Bow") when "type" is given
+def selectMaterialsBySpeed(connect, minSpeed, type=None, display=True):
+	if type is None:
+		rows = runQuery(connect, "materialsBySpeed", (minSpeed,))
+	else:
+		rows = runQuery(connect, "materialsOfTypeBySpeed", (type, minSpeed))
+	if display:
+		printRows("List Of All %s With a Speed of %g or Above:" % (type + "s" if type else "Materials", minSpeed), rows)
+	return rows
+
+# Returns the forgeability perk names that require a higher level than "level"
+def selectPerksAboveLevel(connect, level, display=True):
+	rows = runQuery(connect, "perksAboveLevel", (level,))
+	if display:
+		printRows("List Of Forging Perks that Require a Level Higher Than %d:" % level, rows)
+	return rows
+
+# Returns the (name, effect) of every enchantment available for a weapon type
+def selectEnchantmentsForType(connect, type, display=True):
+	rows = runQuery(connect, "enchantmentsForType", (type,))
+	if display:
+		printRows("List Of All Available Enchantments for %ss:" % type, rows)
+	return rows
+
+# Returns the (damage, weight, name) of every material with a damage higher
+# than "damage"
+def selectDamageAbove(connect, damage, display=True):
+	rows = runQuery(connect, "damageAbove", (damage,))
+	if display:
+		printRows("List Of Weapons With a Damage Higher Than %d:" % damage, rows)
+	return rows
+
+# Returns all Iron Weapons
+def selectIronWeapons(connect, display=True):
+	rows = selectWeaponsByMaterial(connect, "Iron", display=False)
+	if display:
+		printRows("List Of All Iron Weapons:", rows)
+	return rows
+
+# Returns all bows that have a type speed of over 0.75
+def selectBowsBySpeed(connect, display=True):
+	rows = selectMaterialsBySpeed(connect, 0.75, display=False)
+	if display:
+		printRows("List Of All Bows That Have a Speed of 0.75 of Above:", rows)
+	return rows
+
+# Returns all of the weapons with enchantments in the database
+def selectEnchantedWeapons(connect, display=True):
+	rows = runQuery(connect, "enchantedWeapons")
+	if display:
+		printRows("List Of All Enchanted Items in the Database:", rows)
+	return rows
+
+# Returns the forgeability perk names that require a higher level than 20
+def selectForgeabilityPerkLevel(connect, display=True):
+	rows = selectPerksAboveLevel(connect, 20, display=False)
+	if display:
+		printRows("List Of Forging Perks that Require a Level Higher Than 20:", rows)
+	return rows
+
+# Returns the one-handed and two-handed dwarven axes
+def selectAllDwarvenAxes(connect, display=True):
+	rows = (selectWeaponsByMaterial(connect, "Dwarven", "One-Handed Axe", display=False)
+		+ selectWeaponsByMaterial(connect, "Dwarven", "Two-Handed Axe", display=False))
+	if display:
+		printRows("List Of Dwarven Axes:", rows)
+	return rows
+
+# Returns all available enchantments for Warhammers/Two-Handed Maces
+def selectEnchantmentsForWarhammers(connect, display=True):
+	rows = selectEnchantmentsForType(connect, "Two-Handed Mace", display=False)
+	if display:
+		printRows("List Of All Available Enchantments for Warhammers/Two-Handed Maces:", rows)
+	return rows
+
+# Returns all weapons that have a damage higher than 13
+def selectHighestDamage(connect, display=True):
+	rows = selectDamageAbove(connect, 13, display=False)
+	if display:
+		printRows("List Of The Highest Damage Weapons, Alongside Their Weight and Material:", rows)
+	return rows
+
+# Returns the full stats of one weapon by its ID as a single row of
+# (ID, Name, Type, Material, Weight, Damage, Value, Speed, Forgeability)
+def selectWeaponStats(connect, weaponID):
+	rows = runQuery(connect, "weaponStats", (weaponID,))
+	return rows[0] if rows else None
+
+# Returns the whole stat sheet of one weapon by its ID: its type, material,
+# forging perk and enchantments, read from the WeaponStats table
+def selectWeaponStatSheet(connect, weaponID):
+	rows = runQuery(connect, "weaponStatSheet", (weaponID,))
+	return rows[0] if rows else None
+
+# STREAMING
+# The functions above read a whole result into memory (and into the cache).
+# For big modded catalogs, streamQuery() instead pages through a registered
+# query "arraysize" rows at a time with fetchmany, so memory use does not
+# grow with the size of the result. Streamed rows bypass the read cache.
+DEFAULT_ARRAYSIZE = 256
+
+# namedtuple classes already made for a (query, columns) pair
+recordTypes = {}
+
+# Returns a namedtuple class for a query's rows, with its column names as
+# fields. namedtuples have no per-instance __dict__, so they stay as compact
+# as plain tuples.
+def recordType(name, description):
+	columns = tuple(column[0] for column in description)
+	key = (name, columns)
+	if key not in recordTypes:
+		recordTypes[key] = collections.namedtuple(name[0].upper() + name[1:] + "Record", columns, rename=True)
+	return recordTypes[key]
+
+# Yields the rows of a registered query one at a time, as plain tuples or,
+# with records=True, as namedtuples (e.g. row.Name, row.Damage)
+def streamQuery(connect, name, params=(), arraysize=DEFAULT_ARRAYSIZE, records=False):
+	cursor = connect.cursor()
+	cursor.arraysize = arraysize
+	try:
+		cursor.execute(QUERIES[name], params)
+		make = recordType(name, cursor.description)._make if records else None
+		rows = cursor.fetchmany()
+		while rows:
+			for row in rows:
+				yield make(row) if make else row
+			rows = cursor.fetchmany()
+	finally:
+		cursor.close()
+
+# Yields the rows of a registered query as columns instead: one dictionary
+# of {column name: list of values} per batch of at most "arraysize" rows
+def streamColumns(connect, name, params=(), arraysize=DEFAULT_ARRAYSIZE):
+	cursor = connect.cursor()
+	cursor.arraysize = arraysize
+	try:
+		cursor.execute(QUERIES[name], params)
+		columns = [column[0] for column in cursor.description]
+		rows = cursor.fetchmany()
+		while rows:
+			yield {column: [row[index] for row in rows] for index, column in enumerate(columns)}
+			rows = cursor.fetchmany()
+	finally:
+		cursor.close()
+
+# Prints the results of every query above
+def printQueryResults(connect):
+	print()
+	print("QUERY RESULTS DISPLAYED BELOW")
+	# Query #1: Every iron weapon
+	selectIronWeapons(connect)
+	selectBowsBySpeed(connect)
+	selectEnchantedWeapons(connect)
+	selectForgeabilityPerkLevel(connect)
+	selectAllDwarvenAxes(connect)
+	selectEnchantmentsForWarhammers(connect)
+	selectHighestDamage(connect)
+	print("Stats Of The Ebony War Axe:")
+	print(selectWeaponStats(connect, "000139ab"))
+	print()
+	print("Stat Sheet Of The Iron Sword:")
+	print(selectWeaponStatSheet(connect, "00012eb7"))
+	print()
@@ -0,0 +1,95 @@
+import itertools
+import threading
+import time
+
+from . import connection
+from .cache import queryCache
+from .pool import PRAGMAS, configureConnection
+
+# MEMORY REPLICA
+# Query nodes never write, yet reading the database file costs page cache
+# lookups and file locks on every statement. A MemoryReplica copies the
+# whole database into memory with the backup API and hands each thread a
+# read-only connection to that copy, the same way ConnectionPool.reader()
+# hands out connections to the file (so AsyncQueries can use either):
+#	replica = MemoryReplica("SkyrimWeaponsDB.db")
+#	rows = selectIronWeapons(replica.reader(), False)
+# The copy is a shared-cache memory database, so every thread reads the
+# same copy instead of making its own.
+# At most every "checkInterval" seconds, reader() asks SQLite whether the
+# file changed since the copy was made (PRAGMA data_version, which changes
+# whenever another connection commits). If it did, a new copy is made and
+# swapped in: threads get a connection to the new copy on their next call,
+# and the old copy is freed once its last connection is closed.
+
+# Numbers the copies, so each one gets its own memory database name
+copyNumbers = itertools.count()
+
+class MemoryReplica:
+	def __init__(self, database=None, checkInterval=1.0):
+		self.database = database or connection.DATABASE
+		self.checkInterval = checkInterval
+		self.lock = threading.Lock()
+		self.local = threading.local()
+		self.readers = []
+		# Read-only, and never inside a transaction, so it never blocks the writer
+		self.source = connection.openConnection("file:%s?mode=ro" % self.database, uri=True, check_same_thread=False)
+		configureConnection(self.source, {"busy_timeout": PRAGMAS["busy_timeout"]})
+		self.copy = None
+		self.version = None
+		self.generation = 0
+		self.swaps = 0
+		self.refresh(force=True)
+
+	# Makes a new copy if the file changed since the last one (or always,
+	# with force=True) and swaps it in. Returns whether it did.
+	def refresh(self, force=False):
+		with self.lock:
+			self.lastCheck = time.monotonic()
+			version = self.source.execute("PRAGMA data_version").fetchone()[0]
+			if not force and version == self.version:
+				return False
+			uri = "file:skyrimweapondb-replica-%d?mode=memory&cache=shared" % next(copyNumbers)
+			copy = connection.openConnection(uri, uri=True, check_same_thread=False)
+			self.source.backup(copy)
+			old = self.copy
+			self.copy, self.uri, self.version = copy, uri, version
+			self.generation += 1
+			self.swaps += 1
+			if old is not None:
+				old.close()
+		# Cached results of the old copy are stale
+		queryCache.clear()
+		return True
+
+	# Returns the calling thread's read-only connection to the current copy
+	def reader(self):
+		if time.monotonic() - self.lastCheck >= self.checkInterval:
+			self.refresh()
+		connect = getattr(self.local, "connect", None)
+		if connect is None or self.local.generation != self.generation:
+			with self.lock:
+				if connect is not None:
+					self.readers.remove(connect)
+					queryCache.forget(connect)
+					connect.close()
+				connect = connection.openConnection(self.uri, uri=True, check_same_thread=False)
+				connect.execute("PRAGMA query_only = ON")
+				self.readers.append(connect)
+				self.local.connect = connect
+				self.local.generation = self.generation
+		return connect
+
+	# Closes every connection. Read connections belong to their threads, so
+	# this should only be called once those threads are done.
+	def close(self):
+		with self.lock:
+			for connect in self.readers:
+				queryCache.forget(connect)
+				connect.close()
+			self.readers = []
+			self.local = threading.local()
+			if self.copy is not None:
+				self.copy.close()
+				self.copy = None
+			self.source.close()
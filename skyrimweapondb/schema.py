@@ -0,0 +1,456 @@
+# SCHEMA
+# The tables, keys, indexes, views and triggers of the Skyrim Weapon Database.
+from .cache import queryCache
+
+# The columns of every table, in the same order as the tuples that the
+# create methods in loader.py take.
+TABLE_COLUMNS = {
+	"Weapon": ("ID", "Name", "Type", "Material"),
+	"Type": ("Name", "Speed", "Stagger", "Reach"),
+	"Material": ("Name", "Type", "Weight", "Damage", "Value", "Speed", "Forgeability"),
+	"Forgeability": ("Level", "Perk_Name"),
+	"Enchanting": ("Name", "Effect", "Weapon"),
+	"EnchantedWith": ("ID", "EnchantmentName"),
+}
+
+# The Python type of every column, in the same order as TABLE_COLUMNS.
+# Type's Speed, Stagger and Reach hold fractions (e.g. 0.75) despite being
+# declared INTEGER, so they are read as floats.
+COLUMN_TYPES = {
+	"Weapon": (str, str, str, str),
+	"Type": (str, float, float, float),
+	"Material": (str, str, float, int, int, float, str),
+	"Forgeability": (int, str),
+	"Enchanting": (str, str, str),
+	"EnchantedWith": (str, str),
+}
+
+# The columns that uniquely identify a row of each table
+TABLE_KEYS = {
+	"Weapon": ("ID",),
+	"Type": ("Name",),
+	"Material": ("Name", "Type"),
+	"Forgeability": ("Perk_Name",),
+	"Enchanting": ("Name",),
+	"EnchantedWith": ("ID", "EnchantmentName"),
+}
+
+# The tables a DLC or mod pack can add rows to, in the order they are
+# loaded: every table comes after the tables its foreign keys point at.
+PACK_TABLES = ("Forgeability", "Material", "Weapon")
+
+# The columns the full-text search indexes of each table cover
+SEARCH_COLUMNS = {
+	"Weapon": ("Name",),
+	"Enchanting": ("Name", "Effect"),
+}
+
+# TABLE CREATION
+# Creates all six tables on the given connection. Every table uses
+# "IF NOT EXISTS", so calling this on an existing database is harmless.
+def createTables(connect):
+	cursor = connect.cursor()
+
+	# The "Weapon" table is the 'main' table of the database.
+	# ID is the primary key of this database because in Skyrim,
+	# IDs are used as the unique identifiers for every object in
+	# the game.
+	# Beyond an ID, each weapon consists of a type and a material.
+	# These aspects are made into their own separate tables, as seen below.
+	# ======================================================
+	# THIS TABLE SATISFIES:
+	#     1. Total participation constraint
+	#		An ID cannot exist without a weapon and a weapon
+	#		cannot exist without an ID.
+	#     2. Foreign key
+	#		Both Type and Material are foreign keys.
+	#     3. Non-M:N cardinality restraint
+	#		The relation of Weapon to Type and Material is 1:N,
+	#		Since there can only be one Type/Material to a weapon,
+	#		But the options are more than one.
+	#	  4. First relation type (weapon HAS type AND material)
+	# Older databases point Material at Material("Name") alone, which is not
+	# a key of Material, so SQLite rejects every insert once foreign keys
+	# are enforced.
+	retired = retireTable(cursor, "Weapon", '''SELECT 1 FROM pragma_foreign_key_list('Weapon')
+		WHERE "table" = 'Material' GROUP BY id HAVING COUNT(*) < 2''')
+	cursor.execute('''CREATE TABLE IF NOT EXISTS "Weapon" (
+		"ID"	TEXT NOT NULL UNIQUE,
+		"Name"  TEXT NOT NULL,
+		"Type"	TEXT NOT NULL,
+		"Material"	TEXT NOT NULL,
+		"Pack"	TEXT,
+		PRIMARY KEY("ID"),
+		FOREIGN KEY("Type") REFERENCES "Type"("Name"),
+		FOREIGN KEY("Material", "Type") REFERENCES "Material"("Name", "Type")
+		);''')
+	if retired:
+		restoreTable(cursor, "Weapon")
+
+	# The "Type" table defines what the weapon is (sword, battleaxe, etc),
+	# Its handedness (one-handed, two-handed, archery),
+	# and the values inherent to type
+	# NOTE: Melee and archery handedness are defined by different variables
+	# i.e. melee --> speed, stagger, reach
+	#      archery -->  stagger
+	# Hence, only "Name" and "Stagger" are NOT NULL
+	# ======================================================
+	# THIS TABLE SATISFIES:
+	#     1. First entity type
+	cursor.execute('''CREATE TABLE IF NOT EXISTS "Type" (
+		"Name"	TEXT NOT NULL,
+		"Speed"	INTEGER,
+		"Stagger"	INTEGER NOT NULL,
+		"Reach"	INTEGER
+		);''')
+
+	# The "Material" table defines the material the weapon is made out of
+	# and the values that modify each weapon, including its type.
+	# NOTE: Archery adds "Speed" as a material modifier on top of "Weight",
+	# "Damage", and "Value".
+	# This "Speed" value is DIFFERENT to the type table's "Speed"
+	# A row holds the values of one material for one weapon type, so
+	# (Name, Type) is the key a weapon's (Material, Type) points at.
+	# Databases made before "Type" was added cannot be converted, since
+	# their rows never said which type they were for. That table is
+	# dropped here and rebuilt by the seed data.
+	# ======================================================
+	# THIS TABLE SATISFIES:
+	#     1. Second entity type
+	cursor.execute("SELECT name FROM pragma_table_info('Material')")
+	columns = [row[0] for row in cursor.fetchall()]
+	if columns and "Type" not in columns:
+		cursor.execute('DROP TABLE "Material"')
+	# Older databases point the Forgeability foreign key at a "Perk Name"
+	# column that does not exist, which SQLite rejects once foreign keys
+	# are enforced.
+	retired = retireTable(cursor, "Material",
+		"SELECT 1 FROM pragma_foreign_key_list('Material') WHERE \"to\" = 'Perk Name'")
+	cursor.execute('''CREATE TABLE IF NOT EXISTS "Material" (
+		"Name"	TEXT NOT NULL,
+		"Type"	TEXT NOT NULL,
+		"Weight"	REAL NOT NULL,
+		"Damage"	INTEGER NOT NULL,
+		"Value"	INTEGER NOT NULL,
+		"Speed"	REAL,
+		"Forgeability"	TEXT,
+		"Pack"	TEXT,
+		PRIMARY KEY("Name", "Type"),
+		FOREIGN KEY("Type") REFERENCES "Type"("Name"),
+		FOREIGN KEY("Forgeability") REFERENCES "Forgeability"("Perk_Name")
+		);''')
+	if retired:
+		restoreTable(cursor, "Material")
+
+	# The "Forgeability" table defines the perk required to create and temper
+	# weapons by material in the game. The availability of this perk is based
+	# on the character's level.
+	# ======================================================
+	# THIS TABLE SATISFIES:
+	#     1. Composite attribute
+	#		The value of "Forgeability" in "Material" consists of two different
+	#		types of values, "Level" and "Perk Name"
+	cursor.execute('''CREATE TABLE IF NOT EXISTS "Forgeability" (
+		"Level"	INTEGER,
+		"Perk_Name"	TEXT,
+		"Pack"	TEXT
+		);''')
+
+	# The "Enchanting" table defines the types of enchants available
+	# for each weapon and its type.
+	# ======================================================
+	# THIS TABLE SATISFIES:
+	#     1. Multivalued attribute
+	#		Multiple similar enchantment values are available to weapons
+	#		as an attribute.
+	cursor.execute('''CREATE TABLE IF NOT EXISTS "Enchanting" (
+		"Name"	TEXT,
+		"Effect"	TEXT,
+		"Weapon"	TEXT
+		);''')
+
+	# The "Enchanted With" table defines the relationship between a weapon
+	# and an enchantment, using the ID and enchantment name.
+	# Deleting a weapon or an enchantment deletes its rows here too
+	# (ON DELETE CASCADE), so no row is left pointing at nothing.
+	# ======================================================
+	# THIS TABLE SATISFIES:
+	#     1. Second relation type (weapon CAN BE enchanted)
+	retired = retireTable(cursor, "EnchantedWith",
+		"SELECT 1 FROM pragma_foreign_key_list('EnchantedWith') WHERE on_delete != 'CASCADE'")
+	cursor.execute('''CREATE TABLE IF NOT EXISTS "EnchantedWith" (
+		"ID"	TEXT,
+		"EnchantmentName"	TEXT,
+		FOREIGN KEY("ID") REFERENCES "Weapon"("ID") ON DELETE CASCADE,
+		FOREIGN KEY("EnchantmentName") REFERENCES "Enchanting"("Name") ON DELETE CASCADE
+		);''')
+	if retired:
+		restoreTable(cursor, "EnchantedWith")
+		# Rows whose weapon or enchantment was deleted before the cascade existed
+		cursor.execute('''DELETE FROM EnchantedWith
+			WHERE ID NOT IN (SELECT ID FROM Weapon)
+			OR EnchantmentName NOT IN (SELECT Name FROM Enchanting)''')
+
+	# PACKS
+	# "Pack" names the DLC or mod pack a row was loaded from (see packs.py),
+	# and is NULL for the base game. It is not one of TABLE_COLUMNS: only the
+	# pack loader writes it. Databases made before packs existed get the
+	# column added here, and an index on it lets a pack be unloaded with one
+	# indexed DELETE per table.
+	for table in PACK_TABLES:
+		cursor.execute("SELECT 1 FROM pragma_table_info(?) WHERE name = 'Pack'", (table,))
+		if cursor.fetchone() is None:
+			cursor.execute('ALTER TABLE "%s" ADD COLUMN "Pack" TEXT' % table)
+		cursor.execute('CREATE INDEX IF NOT EXISTS "%s_Pack" ON "%s"("Pack")' % (table, table))
+
+	# UNIQUE KEYS
+	# The natural key of every table (see TABLE_KEYS below). These are what
+	# the seed script upserts against, so running it again updates rows in
+	# place instead of failing or inserting duplicates.
+	# Weapon and Material are keyed by their primary keys.
+	cursor.execute('''CREATE UNIQUE INDEX IF NOT EXISTS "Type_Name"
+		ON "Type"("Name");''')
+	cursor.execute('''CREATE UNIQUE INDEX IF NOT EXISTS "Forgeability_Perk_Name"
+		ON "Forgeability"("Perk_Name");''')
+	cursor.execute('''CREATE UNIQUE INDEX IF NOT EXISTS "Enchanting_Name"
+		ON "Enchanting"("Name");''')
+	cursor.execute('''CREATE UNIQUE INDEX IF NOT EXISTS "EnchantedWith_ID_EnchantmentName"
+		ON "EnchantedWith"("ID", "EnchantmentName");''')
+
+	# SECONDARY INDEXES
+	# One index for every column the query, update and deletion functions
+	# filter on, so none of them has to read a whole table.
+	# EnchantedWith(ID) and Material(Name) are already covered by the keys above.
+	# Run "python3 -m skyrimweapondb audit" to check that the queries use them.
+	cursor.execute('''CREATE INDEX IF NOT EXISTS "Weapon_Material_Type"
+		ON "Weapon"("Material", "Type");''')
+	cursor.execute('''CREATE INDEX IF NOT EXISTS "Weapon_Name"
+		ON "Weapon"("Name");''')
+	cursor.execute('''CREATE INDEX IF NOT EXISTS "Material_Damage"
+		ON "Material"("Damage");''')
+	cursor.execute('''CREATE INDEX IF NOT EXISTS "Material_Speed"
+		ON "Material"("Speed");''')
+	cursor.execute('''CREATE INDEX IF NOT EXISTS "Forgeability_Level"
+		ON "Forgeability"("Level");''')
+	cursor.execute('''CREATE INDEX IF NOT EXISTS "Enchanting_Weapon"
+		ON "Enchanting"("Weapon");''')
+	# Used by the WeaponStats triggers below to find the weapons a changed
+	# type, perk or enchantment belongs to.
+	cursor.execute('''CREATE INDEX IF NOT EXISTS "Weapon_Type"
+		ON "Weapon"("Type");''')
+	cursor.execute('''CREATE INDEX IF NOT EXISTS "Material_Forgeability"
+		ON "Material"("Forgeability");''')
+	cursor.execute('''CREATE INDEX IF NOT EXISTS "EnchantedWith_EnchantmentName"
+		ON "EnchantedWith"("EnchantmentName");''')
+
+	# VIEWS
+	# "ResolvedWeapon" puts every weapon next to the stats of its exact
+	# material row. The join is on the full (Name, Type) key, so a weapon
+	# matches at most one material row and looking one up by ID is two
+	# primary-key searches instead of a fan-out over every type.
+	cursor.execute('''CREATE VIEW IF NOT EXISTS "ResolvedWeapon" AS
+		SELECT Weapon.ID, Weapon.Name, Weapon.Type, Weapon.Material,
+			Material.Weight, Material.Damage, Material.Value, Material.Speed,
+			Material.Forgeability
+		FROM Weapon
+		LEFT JOIN Material
+			ON Material.Name = Weapon.Material AND Material.Type = Weapon.Type;''')
+
+	# "WeaponStatsView" is the full stat sheet of every weapon: its type,
+	# material, forging perk and enchantments in one wide row. The
+	# enchantments are listed with subqueries rather than a GROUP BY so that
+	# filtering the view by ID only ever touches that one weapon.
+	cursor.execute('''CREATE VIEW IF NOT EXISTS "WeaponStatsView" AS
+		SELECT Weapon.ID, Weapon.Name, Weapon.Type, Weapon.Material,
+			Type.Speed AS TypeSpeed, Type.Stagger, Type.Reach,
+			Material.Weight, Material.Damage, Material.Value,
+			Material.Speed AS MaterialSpeed, Material.Forgeability,
+			Forgeability.Level AS ForgeLevel,
+			(SELECT group_concat(EnchantmentName, ', ') FROM EnchantedWith
+				WHERE EnchantedWith.ID = Weapon.ID) AS Enchantments,
+			(SELECT group_concat(Enchanting.Effect, '; ') FROM EnchantedWith
+				JOIN Enchanting ON Enchanting.Name = EnchantedWith.EnchantmentName
+				WHERE EnchantedWith.ID = Weapon.ID) AS EnchantmentEffects
+		FROM Weapon
+		LEFT JOIN Type ON Type.Name = Weapon.Type
+		LEFT JOIN Material
+			ON Material.Name = Weapon.Material AND Material.Type = Weapon.Type
+		LEFT JOIN Forgeability ON Forgeability.Perk_Name = Material.Forgeability;''')
+
+	# MATERIALIZED STATS
+	# "WeaponStats" stores WeaponStatsView as a real table, one row per weapon
+	# ID, so reading a full stat sheet is a single primary-key fetch instead
+	# of a join over five tables. Triggers on all six base tables keep it up
+	# to date: every change recomputes only the weapons that it affects.
+	cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'WeaponStats'")
+	statsExisted = cursor.fetchone() is not None
+	cursor.execute('''CREATE TABLE IF NOT EXISTS "WeaponStats" (
+		"ID"	TEXT NOT NULL,
+		"Name"	TEXT,
+		"Type"	TEXT,
+		"Material"	TEXT,
+		"TypeSpeed"	REAL,
+		"Stagger"	REAL,
+		"Reach"	REAL,
+		"Weight"	REAL,
+		"Damage"	INTEGER,
+		"Value"	INTEGER,
+		"MaterialSpeed"	REAL,
+		"Forgeability"	TEXT,
+		"ForgeLevel"	INTEGER,
+		"Enchantments"	TEXT,
+		"EnchantmentEffects"	TEXT,
+		PRIMARY KEY("ID")
+		) WITHOUT ROWID;''')
+	# For each base table, the IDs of the weapons whose stat sheet depends
+	# on one of its rows ({row} is NEW or OLD inside the trigger)
+	affectedWeapons = {
+		"Weapon": "SELECT {row}.ID",
+		"Type": "SELECT ID FROM Weapon WHERE Type = {row}.Name",
+		"Material": "SELECT ID FROM Weapon WHERE Material = {row}.Name AND Type = {row}.Type",
+		"Forgeability": '''SELECT Weapon.ID FROM Material
+			JOIN Weapon ON Weapon.Material = Material.Name AND Weapon.Type = Material.Type
+			WHERE Material.Forgeability = {row}.Perk_Name''',
+		"Enchanting": "SELECT ID FROM EnchantedWith WHERE EnchantmentName = {row}.Name",
+		"EnchantedWith": "SELECT {row}.ID",
+	}
+	for table, weapons in affectedWeapons.items():
+		for event, rows in (("INSERT", ["NEW"]), ("UPDATE", ["OLD", "NEW"]), ("DELETE", ["OLD"])):
+			IDs = " UNION ".join(weapons.format(row=row) for row in rows)
+			cursor.execute('''CREATE TRIGGER IF NOT EXISTS "WeaponStats_%s_%s"
+				AFTER %s ON "%s"
+				BEGIN
+					DELETE FROM WeaponStats WHERE ID IN (%s);
+					INSERT INTO WeaponStats SELECT * FROM WeaponStatsView WHERE ID IN (%s);
+				END;''' % (table, event, event, table, IDs, IDs))
+	if not statsExisted:
+		rebuildWeaponStats(connect)
+
+	# SEARCH
+	# "WeaponSearch" and "EnchantingSearch" are FTS5 full-text indexes of
+	# the SEARCH_COLUMNS, for the ranked prefix search in search.py. They
+	# are external-content tables: they hold only the index and read the
+	# text from Weapon and Enchanting by rowid, and triggers keep them in
+	# step with every insert, update and delete. The prefix option also
+	# indexes every 2- to 6-letter prefix of every word, so autocompleting
+	# "Dw" or "Dwarv" is one index lookup instead of a merge of the rows of
+	# every word that starts with it. SQLite builds without FTS5 get no
+	# index, and search.py falls back to LIKE.
+	cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+	if cursor.fetchone()[0]:
+		for table, columns in SEARCH_COLUMNS.items():
+			createSearchIndex(cursor, table, columns)
+
+	# CHANGE LOG
+	# "ChangeLog" records every insert, update and delete of the six base
+	# tables, numbered by "Sequence" in the order they happened, so another
+	# copy of the database can be brought up to date by shipping only the
+	# changes since it was last synced (see changelog.py). AUTOINCREMENT
+	# keeps sequence numbers from ever being reused, even once old changes
+	# are pruned. "RowKey" holds the row's TABLE_KEYS values as a JSON
+	# array (the old ones, for an update that changes the key), and
+	# "RowData" the whole new row as a JSON object (NULL for a delete).
+	# "ChangeSync" records, in a copy, the last change of each source it
+	# has applied.
+	cursor.execute('''CREATE TABLE IF NOT EXISTS "ChangeLog" (
+		"Sequence"	INTEGER PRIMARY KEY AUTOINCREMENT,
+		"TableName"	TEXT NOT NULL,
+		"Operation"	TEXT NOT NULL,
+		"RowKey"	TEXT NOT NULL,
+		"RowData"	TEXT
+		);''')
+	cursor.execute('''CREATE TABLE IF NOT EXISTS "ChangeSync" (
+		"Source"	TEXT NOT NULL PRIMARY KEY,
+		"Sequence"	INTEGER NOT NULL
+		);''')
+	for table in TABLE_COLUMNS:
+		createChangeLogTriggers(cursor, table)
+	connect.commit()
+	# Every connection that creates or opens the schema enforces its
+	# foreign keys (see also getConnection and PRAGMAS)
+	cursor.execute("PRAGMA foreign_keys = ON")
+
+# Creates the FTS5 index of "columns" of a table, "<table>Search", and the
+# triggers that keep it in sync, and fills it if it is new
+def createSearchIndex(cursor, table, columns):
+	search = table + "Search"
+	cursor.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (search,))
+	existed = cursor.fetchone() is not None
+	cursor.execute('''CREATE VIRTUAL TABLE IF NOT EXISTS "%s" USING fts5(%s,
+		content='%s', content_rowid='rowid', prefix='2 3 4 5 6')''' % (search, ", ".join(columns), table))
+	names = ", ".join(columns)
+	def values(row):
+		return ", ".join("%s.%s" % (row, column) for column in columns)
+	remove = "INSERT INTO \"%s\"(\"%s\", rowid, %s) VALUES ('delete', OLD.rowid, %s);" % (search, search, names, values("OLD"))
+	add = "INSERT INTO \"%s\"(rowid, %s) VALUES (NEW.rowid, %s);" % (search, names, values("NEW"))
+	for event, body in (("INSERT", add), ("UPDATE OF " + names, remove + add), ("DELETE", remove)):
+		cursor.execute('''CREATE TRIGGER IF NOT EXISTS "%s_%s" AFTER %s ON "%s"
+			BEGIN %s END;''' % (search, event.split()[0], event, table, body))
+	if not existed:
+		cursor.execute("INSERT INTO \"%s\"(\"%s\") VALUES ('rebuild')" % (search, search))
+
+# Creates the triggers that record every change of a table in ChangeLog.
+# An update that leaves every column as it was is not recorded.
+def createChangeLogTriggers(cursor, table):
+	columns = TABLE_COLUMNS[table] + (("Pack",) if table in PACK_TABLES else ())
+	def key(row):
+		return "json_array(%s)" % ", ".join('%s."%s"' % (row, column) for column in TABLE_KEYS[table])
+	data = "json_object(%s)" % ", ".join("'%s', NEW.\"%s\"" % (column, column) for column in columns)
+	changed = " OR ".join('OLD."%s" IS NOT NEW."%s"' % (column, column) for column in columns)
+	for event, when, row, values in (("INSERT", "", "NEW", data), ("UPDATE", "WHEN " + changed, "OLD", data),
+			("DELETE", "", "OLD", "NULL")):
+		cursor.execute('''CREATE TRIGGER IF NOT EXISTS "ChangeLog_%s_%s" AFTER %s ON "%s" %s
+			BEGIN
+				INSERT INTO ChangeLog (TableName, Operation, RowKey, RowData)
+				VALUES ('%s', '%s', %s, %s);
+			END;''' % (table, event, event, table, when, table, event, key(row), values))
+
+# Rebuilds the search indexes from their tables. The triggers keep them
+# current on their own, but VACUUM may renumber the rowids they point at.
+# With "commit" False the rebuild is left in the caller's transaction.
+def rebuildSearchIndexes(connect, commit=True):
+	cursor = connect.cursor()
+	for table in SEARCH_COLUMNS:
+		cursor.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (table + "Search",))
+		if cursor.fetchone() is not None:
+			cursor.execute("INSERT INTO \"%sSearch\"(\"%sSearch\") VALUES ('rebuild')" % (table, table))
+	if commit:
+		connect.commit()
+
+# FOREIGN KEY MIGRATION
+# SQLite can't change the foreign keys of an existing table. When "outdated"
+# (a query) returns a row, the table is renamed to "<table>_old" so that its
+# CREATE TABLE makes it again with the current keys; restoreTable then copies
+# the rows over and drops the old table. Renaming in legacy mode leaves the
+# views, triggers and other tables that mention the table alone.
+# Returns whether the table was renamed.
+def retireTable(cursor, table, outdated):
+	cursor.execute(outdated)
+	if cursor.fetchone() is None:
+		return False
+	cursor.execute("PRAGMA foreign_keys = OFF")
+	cursor.execute("PRAGMA legacy_alter_table = ON")
+	cursor.execute('ALTER TABLE "%s" RENAME TO "%s_old"' % (table, table))
+	cursor.execute("PRAGMA legacy_alter_table = OFF")
+	return True
+
+# Copies the rows of a table retired by retireTable into its new table and
+# drops the old one. Columns the old table didn't have are left NULL.
+def restoreTable(cursor, table):
+	cursor.execute("SELECT name FROM pragma_table_info(?) WHERE name IN (SELECT name FROM pragma_table_info(?))",
+		(table, table + "_old"))
+	columns = ", ".join('"%s"' % row[0] for row in cursor.fetchall())
+	cursor.execute('INSERT INTO "%s" (%s) SELECT %s FROM "%s_old"' % (table, columns, columns, table))
+	cursor.execute('DROP TABLE "%s_old"' % table)
+
+# Recomputes the whole WeaponStats table from the base tables. The triggers
+# keep it current on their own; this is only needed to fill it the first time
+# or to repair it after the triggers were bypassed.
+# With "commit" False the rebuild is left in the caller's transaction.
+def rebuildWeaponStats(connect, commit=True):
+	cursor = connect.cursor()
+	cursor.execute("DELETE FROM WeaponStats")
+	cursor.execute("INSERT INTO WeaponStats SELECT * FROM WeaponStatsView")
+	if commit:
+		connect.commit()
+	queryCache.invalidate("WeaponStats")
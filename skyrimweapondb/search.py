@@ -0,0 +1,78 @@
+# SEARCH
+# Autocomplete and free-text search over weapon names and enchantments,
+# answered from the FTS5 indexes that createTables keeps in sync (see the
+# SEARCH section of schema.py) instead of LIKE '%...%' scans.
+# Every word of the search text is matched as a prefix, and a row must
+# match all of them: "dwa war" finds the Dwarven War Axe and Dwarven
+# Warhammer.
+# Enchantments come best first by FTS5's bm25 rank, where a match in the
+# name counts ten times a match in the effect. bm25 has to count every
+# row that holds each word, which takes ~100ms for a word that is in most
+# of 100k weapon names, so weapon names are ranked as completions instead:
+# out of every match, the shortest names, i.e. the closest completions,
+# come first. Only the best "limit" rows are kept while sorting, so even a
+# word in all of 100k names takes ~15ms.
+import re
+
+from .cache import queryCache
+
+SEARCH_QUERIES = {
+	"weapons": '''SELECT Weapon.ID, Weapon.Name, Weapon.Type, Weapon.Material
+		FROM WeaponSearch JOIN Weapon ON Weapon.rowid = WeaponSearch.rowid
+		WHERE WeaponSearch MATCH ?
+		ORDER BY length(Weapon.Name), Weapon.Name LIMIT ?''',
+	"enchantments": '''SELECT Enchanting.Name, Enchanting.Effect, Enchanting.Weapon
+		FROM EnchantingSearch JOIN Enchanting ON Enchanting.rowid = EnchantingSearch.rowid
+		WHERE EnchantingSearch MATCH ?
+		ORDER BY bm25(EnchantingSearch, 10.0, 1.0), Enchanting.Name LIMIT ?''',
+}
+# The same searches for SQLite builds without FTS5: every word must appear
+# somewhere, in order, and the results are sorted by name
+FALLBACK_QUERIES = {
+	"weapons": '''SELECT ID, Name, Type, Material FROM Weapon WHERE Name LIKE ?
+		ORDER BY length(Name), Name LIMIT ?''',
+	"enchantments": '''SELECT Name, Effect, Weapon FROM Enchanting
+		WHERE Name LIKE ?1 OR Effect LIKE ?1 ORDER BY Name LIMIT ?2''',
+}
+SEARCH_TABLES = {"weapons": "Weapon", "enchantments": "Enchanting"}
+
+# Returns the words of a search text
+def searchTerms(text):
+	return re.findall(r"\w+", text)
+
+# Returns the FTS5 query for a search text: every word quoted, so it can't
+# be read as an FTS5 operator, and marked as a prefix
+def matchExpression(text):
+	return " ".join('"%s"*' % term for term in searchTerms(text))
+
+# Runs one of the searches through the read cache
+def runSearch(connect, name, text, limit):
+	terms = searchTerms(text)
+	if not terms:
+		return ()
+	table = SEARCH_TABLES[name]
+	indexed = connect.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (table + "Search",)).fetchone()
+	if indexed is not None:
+		return queryCache.fetch(connect, SEARCH_QUERIES[name], (matchExpression(text), limit), (table,))
+	return queryCache.fetch(connect, FALLBACK_QUERIES[name], ("%" + "%".join(terms) + "%", limit), (table,))
+
+# Returns (ID, Name, Type, Material) of the best "limit" weapons whose
+# name matches a search text, e.g. searchWeapons(connect, "Dwa")
+def searchWeapons(connect, text, limit=10):
+	return runSearch(connect, "weapons", text, limit)
+
+# Returns (Name, Effect, Weapon) of the best "limit" enchantments whose
+# name or effect matches a search text, e.g. searchEnchantments(connect, "frost")
+def searchEnchantments(connect, text, limit=10):
+	return runSearch(connect, "enchantments", text, limit)
+
+# Prints the weapons and enchantments that match a search text
+def printSearchResults(connect, text, limit=10):
+	print("Weapons Matching %r:" % text)
+	for row in searchWeapons(connect, text, limit):
+		print(row)
+	print()
+	print("Enchantments Matching %r:" % text)
+	for row in searchEnchantments(connect, text, limit):
+		print(row)
+	print()
@@ -0,0 +1,239 @@
+# SHARDED BUILD
+# build() reads and writes every seed file through one connection, one
+# after the other. For a catalog merged from hundreds of mod packs,
+# buildSharded() splits the work instead:
+#	1. The sources (the base game's seed directory, then every pack
+#	   directory, in order) are split into one contiguous run of sources
+#	   per process, of about the same total file size.
+#	2. Each process reads and checks its sources' seed files exactly like
+#	   importSeedFiles and loadPackDirectory do, and writes the rows to its
+#	   own temporary SQLite file (a shard) with the database's tables and
+#	   unique keys, but no triggers or foreign keys.
+#	3. The shards are ATTACHed to the database and copied in with one
+#	   INSERT ... SELECT per table and shard, in ONE transaction. The
+#	   triggers are dropped for the copy and made again afterwards, and
+#	   WeaponStats and the search indexes are rebuilt once, instead of once
+#	   per row, in the same transaction. The rows are not recorded in the change log, which starts
+#	   out empty (see changelog.py).
+# Foreign keys are checked once the rows of every shard are in, so a
+# weapon may use a material from another pack. As with loadPack, a source
+# may list a row that an earlier source already has with the same values;
+# it stays the earlier source's. Any bad value, key listed with different
+# values or missing reference fails the whole build and writes nothing.
+# The database must not hold any rows yet: buildSharded() makes a new
+# database, it does not reload packs into an existing one (see loadPack).
+import concurrent.futures
+import os
+import shutil
+import sqlite3
+import tempfile
+
+from .cache import queryCache
+from .connection import getConnection
+from .importer import SEED_DIRECTORY, SEED_ORDER, readSeedFile, requiredColumns, seedFile
+from .loader import chunked
+from .packs import BUILTIN_PACKS, PACK_DIRECTORY
+from .schema import PACK_TABLES, TABLE_COLUMNS, TABLE_KEYS, createTables, rebuildSearchIndexes, rebuildWeaponStats
+
+# Returns the sources buildSharded() reads by default: the base game and
+# its DLCs, as (directory, pack name) pairs; the pack name of the base game
+# is None
+def defaultSources():
+	return [(SEED_DIRECTORY, None)] + [(os.path.join(PACK_DIRECTORY, name), name) for name in BUILTIN_PACKS]
+
+# Returns the sources for every pack directory directly inside "directory",
+# in name order
+def packSources(directory):
+	return [(os.path.join(directory, name), name) for name in sorted(os.listdir(directory))
+		if os.path.isdir(os.path.join(directory, name))]
+
+# Returns the seed files of a source, as (table, path) pairs in SEED_ORDER.
+# Packs can only add rows to PACK_TABLES, and their other files are ignored
+# the same way loadPackDirectory ignores them.
+def sourceFiles(directory, pack):
+	files = []
+	for table in SEED_ORDER:
+		path = seedFile(directory, table)
+		if path is not None and (pack is None or table in PACK_TABLES):
+			files.append((table, path))
+	if not files:
+		raise ValueError("no seed files found in %s" % directory)
+	return files
+
+# Splits the sources into at most "count" runs of neighbouring sources, of
+# about the same total seed file size, so each shard holds its sources'
+# rows in the order build() would have written them
+def splitSources(sources, count):
+	sizes = [sum(os.path.getsize(path) for table, path in sourceFiles(*source)) for source in sources]
+	target = sum(sizes) / count
+	runs = [[]]
+	total = 0
+	for source, size in zip(sources, sizes):
+		if runs[-1] and total >= target * len(runs) and len(runs) < count:
+			runs.append([])
+		runs[-1].append(source)
+		total += size
+	return runs
+
+# Returns the name a source goes by in error messages
+def sourceName(pack):
+	return "the base game" if pack is None else "pack %s" % pack
+
+# Checks the rows of a chunk that buildShard didn't write because a row
+# with the same key was already there: like loadPack, a source may list a
+# row that an earlier one already has, but only with the same values
+def checkListedRows(cursor, table, chunk, seedPath):
+	key = TABLE_KEYS[table]
+	columns = TABLE_COLUMNS[table]
+	SQL = 'SELECT %s FROM "%s" WHERE %s' % (", ".join(columns + (("Pack",) if table in PACK_TABLES else ())),
+		table, " AND ".join('"%s" = ?' % column for column in key))
+	for row in chunk:
+		cursor.execute(SQL, tuple(row[columns.index(column)] for column in key))
+		listed = cursor.fetchone()
+		if tuple(listed[:len(columns)]) != tuple(row[:len(columns)]):
+			raise ValueError("%s: %s %s is already listed by %s with different values" % (seedPath, table,
+				", ".join(str(row[columns.index(column)]) for column in key),
+				sourceName(listed[-1] if table in PACK_TABLES else None)))
+
+# Writes the rows of "sources" to a new shard file at "path", whose tables
+# are made with "schema" (see buildSharded). Runs in a worker process.
+# Returns the number of rows written per table.
+def buildShard(path, schema, sources, chunkSize=1000):
+	shard = sqlite3.connect(path)
+	try:
+		shard.execute("PRAGMA journal_mode = OFF")
+		shard.execute("PRAGMA synchronous = OFF")
+		for SQL in schema:
+			shard.execute(SQL)
+		counts = dict.fromkeys(SEED_ORDER, 0)
+		cursor = shard.cursor()
+		cursor.execute("BEGIN")
+		for directory, pack in sources:
+			for table, seedPath in sourceFiles(directory, pack):
+				columns = TABLE_COLUMNS[table] + (("Pack",) if table in PACK_TABLES else ())
+				SQL = 'INSERT INTO "%s" (%s) VALUES (%s) ON CONFLICT DO NOTHING' % (
+					table, ", ".join(columns), ", ".join("?" * len(columns)))
+				rows = readSeedFile(seedPath, table, requiredColumns(shard, table))
+				if table in PACK_TABLES:
+					rows = (row + (pack,) for row in rows)
+				try:
+					for chunk in chunked(rows, chunkSize):
+						cursor.executemany(SQL, chunk)
+						written = cursor.rowcount
+						if written < len(chunk):
+							checkListedRows(cursor, table, chunk, seedPath)
+						counts[table] += written
+				except sqlite3.IntegrityError as error:
+					raise ValueError("%s: %s" % (seedPath, error)) from None
+		shard.commit()
+		return counts
+	finally:
+		shard.close()
+
+# Builds the database of "connect" from "sources" (defaultSources() if not
+# given, see packSources for mod packs) with "processes" worker processes
+# (one per CPU by default). Returns the number of rows written per table.
+def buildSharded(connect=None, sources=None, processes=None, chunkSize=1000):
+	connect = connect or getConnection()
+	sources = defaultSources() if sources is None else list(sources)
+	if not sources:
+		raise ValueError("no sources to build from")
+	createTables(connect)
+	cursor = connect.cursor()
+	for table in SEED_ORDER:
+		cursor.execute('SELECT 1 FROM "%s" LIMIT 1' % table)
+		if cursor.fetchone() is not None:
+			raise ValueError("buildSharded needs an empty database, but %s already has rows" % table)
+	# The shards get the tables and unique keys, and none of the other
+	# indexes or triggers
+	placeholders = ", ".join("?" * len(SEED_ORDER))
+	cursor.execute('''SELECT sql FROM sqlite_master WHERE tbl_name IN (%s) AND sql IS NOT NULL
+		AND (type = 'table' OR sql LIKE 'CREATE UNIQUE INDEX%%')''' % placeholders, SEED_ORDER)
+	schema = [row[0] for row in cursor.fetchall()]
+	# Every shard is attached to the connection at once, so there can't be
+	# more of them than SQLite allows
+	count = min(processes or os.cpu_count() or 1, len(sources), connect.getlimit(sqlite3.SQLITE_LIMIT_ATTACHED))
+	runs = splitSources(sources, count)
+	directory = tempfile.mkdtemp(prefix="skyrimweapondb-shards-")
+	try:
+		paths = [os.path.join(directory, "shard%d.db" % index) for index in range(len(runs))]
+		if len(runs) == 1:
+			buildShard(paths[0], schema, runs[0], chunkSize)
+		else:
+			with concurrent.futures.ProcessPoolExecutor(len(runs)) as executor:
+				for future in [executor.submit(buildShard, path, schema, run, chunkSize) for path, run in zip(paths, runs)]:
+					future.result()
+		return mergeShards(connect, paths)
+	finally:
+		shutil.rmtree(directory)
+
+# Checks that every row of a shard that mergeShards didn't copy, because an
+# earlier shard already had its key, has the same values as that row
+def checkMergedRows(cursor, table, name):
+	key = TABLE_KEYS[table]
+	values = [column for column in TABLE_COLUMNS[table] if column not in key]
+	packs = "Shard.Pack, Main.Pack" if table in PACK_TABLES else "NULL, NULL"
+	cursor.execute('''SELECT %s, %s FROM %s."%s" AS Shard JOIN main."%s" AS Main ON %s
+		WHERE %s LIMIT 1''' % (", ".join("Shard.%s" % column for column in key), packs, name, table, table,
+		" AND ".join("Shard.%s = Main.%s" % (column, column) for column in key),
+		" OR ".join("Shard.%s IS NOT Main.%s" % (column, column) for column in values) or "0"))
+	conflict = cursor.fetchone()
+	if conflict is not None:
+		raise ValueError("%s %s is listed by %s and %s with different values" % (table,
+			", ".join(str(value) for value in conflict[:len(key)]), sourceName(conflict[-1]), sourceName(conflict[-2])))
+
+# Copies the rows of every shard file into the database of "connect", in
+# ONE transaction (see buildSharded). Returns the number of rows written
+# per table.
+def mergeShards(connect, paths):
+	cursor = connect.cursor()
+	connect.commit()
+	names = []
+	counts = {}
+	try:
+		for path in paths:
+			cursor.execute("ATTACH DATABASE ? AS shard%d" % len(names), (path,))
+			names.append("shard%d" % len(names))
+		cursor.execute("BEGIN")
+		try:
+			cursor.execute("PRAGMA defer_foreign_keys = ON")
+			cursor.execute("SELECT name, sql FROM main.sqlite_master WHERE type = 'trigger'")
+			triggers = cursor.fetchall()
+			for trigger, SQL in triggers:
+				cursor.execute('DROP TRIGGER "%s"' % trigger)
+			for table in SEED_ORDER:
+				columns = ", ".join(TABLE_COLUMNS[table] + (("Pack",) if table in PACK_TABLES else ()))
+				counts[table] = 0
+				for name in names:
+					# "WHERE true" tells SQLite the ON CONFLICT belongs to
+					# the INSERT, not the SELECT
+					try:
+						cursor.execute('INSERT INTO main."%s" (%s) SELECT %s FROM %s."%s" WHERE true ORDER BY rowid'
+							' ON CONFLICT DO NOTHING' % (table, columns, columns, name, table))
+					except sqlite3.IntegrityError as error:
+						raise ValueError("%s rows of different packs conflict: %s" % (table, error)) from None
+					counts[table] += cursor.rowcount
+					checkMergedRows(cursor, table, name)
+			for table in SEED_ORDER:
+				cursor.execute("SELECT parent, rowid FROM pragma_foreign_key_check(?) LIMIT 1", (table,))
+				missing = cursor.fetchone()
+				if missing is not None:
+					cursor.execute('SELECT %s FROM "%s" WHERE rowid = ?' % (", ".join(TABLE_COLUMNS[table]), table),
+						(missing[1],))
+					raise ValueError("%s row %s refers to a %s row that no source has"
+						% (table, cursor.fetchone(), missing[0]))
+			for trigger, SQL in triggers:
+				cursor.execute(SQL)
+			rebuildWeaponStats(connect, commit=False)
+			rebuildSearchIndexes(connect, commit=False)
+			connect.commit()
+		except BaseException:
+			connect.rollback()
+			raise
+	finally:
+		for name in names:
+			cursor.execute("DETACH DATABASE %s" % name)
+		for table in counts:
+			queryCache.invalidate(table)
+		queryCache.invalidate("WeaponStats")
+	return counts
@@ -0,0 +1,86 @@
+# SNAPSHOTS
+# A snapshot is the finished database (every table, index, view, trigger
+# and search index) written to one compact file, so a new worker can start
+# serving queries from it instead of running build() again.
+# The file is an ordinary SQLite database, written with VACUUM INTO, which
+# leaves out free pages and stores every table and index in order. It is
+# stamped with SNAPSHOT_APPLICATION_ID and SNAPSHOT_VERSION, and a snapshot
+# of any other format is refused rather than misread.
+# A worker either:
+#	- opens the snapshot read-only with openSnapshot(). Nothing is copied:
+#	  the file is memory-mapped, so pages are read straight from the OS
+#	  page cache and the first query runs within milliseconds, or
+#	- copies it into a database it can write to with restoreSnapshot(),
+#	  which uses the backup API and so copies pages, not rows.
+import os
+import sqlite3
+
+from . import connection
+from .cache import queryCache
+from .schema import rebuildSearchIndexes
+
+# "SKYW", so a snapshot can be told apart from any other SQLite file
+SNAPSHOT_APPLICATION_ID = 0x534B5957
+# Bumped whenever the schema changes in a way older code can't read
+SNAPSHOT_VERSION = 1
+
+# Writes a snapshot of the database of "connect" to "path", replacing any
+# file there only once the new snapshot is complete. Returns its size in
+# bytes.
+def exportSnapshot(connect, path):
+	temporary = path + ".tmp"
+	if os.path.exists(temporary):
+		os.remove(temporary)
+	connect.commit()
+	connect.execute("VACUUM INTO ?", (temporary,))
+	snapshot = sqlite3.connect(temporary)
+	try:
+		snapshot.execute("PRAGMA application_id = %d" % SNAPSHOT_APPLICATION_ID)
+		snapshot.execute("PRAGMA user_version = %d" % SNAPSHOT_VERSION)
+		# VACUUM may renumber the rowids that the search indexes point at
+		rebuildSearchIndexes(snapshot)
+		snapshot.execute("PRAGMA journal_mode = DELETE")
+	finally:
+		snapshot.close()
+	os.replace(temporary, path)
+	return os.path.getsize(path)
+
+# Raises ValueError unless "snapshot" is a connection to a snapshot of the
+# current format
+def checkSnapshot(snapshot, path):
+	try:
+		applicationID = snapshot.execute("PRAGMA application_id").fetchone()[0]
+		version = snapshot.execute("PRAGMA user_version").fetchone()[0]
+	except sqlite3.DatabaseError:
+		raise ValueError("%s is not a weapon database snapshot" % path) from None
+	if applicationID != SNAPSHOT_APPLICATION_ID:
+		raise ValueError("%s is not a weapon database snapshot" % path)
+	if version != SNAPSHOT_VERSION:
+		raise ValueError("%s is a version %d snapshot, this code reads version %d" % (path, version, SNAPSHOT_VERSION))
+
+# Opens a snapshot read-only and returns the connection. The file is
+# opened as immutable (snapshots are only ever replaced, never changed in
+# place), so SQLite takes no locks, and memory-mapped in full.
+def openSnapshot(path):
+	if not os.path.exists(path):
+		raise ValueError("%s does not exist" % path)
+	snapshot = connection.openConnection("file:%s?mode=ro&immutable=1" % os.path.abspath(path), uri=True,
+		check_same_thread=False)
+	try:
+		checkSnapshot(snapshot, path)
+		snapshot.execute("PRAGMA mmap_size = %d" % os.path.getsize(path))
+	except BaseException:
+		snapshot.close()
+		raise
+	return snapshot
+
+# Copies a snapshot over the database of "connect", page by page with the
+# backup API, e.g. restoreSnapshot(getConnection(), "weapons.snapshot")
+def restoreSnapshot(connect, path):
+	snapshot = openSnapshot(path)
+	try:
+		connect.commit()
+		snapshot.backup(connect)
+	finally:
+		snapshot.close()
+		queryCache.clear()
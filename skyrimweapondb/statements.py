@@ -0,0 +1,56 @@
+# STATEMENTS
+# Every statement that writes rows is built here, once, from TABLE_COLUMNS
+# and TABLE_KEYS, and always with "?" parameters instead of values. sqlite3
+# keeps the compiled form of the last "cached_statements" distinct SQL
+# texts of a connection, so running the same text again skips parsing and
+# planning entirely. The read queries are registered the same way in
+# queries.QUERIES.
+import functools
+
+from .schema import TABLE_COLUMNS, TABLE_KEYS
+
+# The size of each connection's statement cache (sqlite3's default is 128).
+# It has room for every registered query and every statement below, with
+# plenty left over for the schema and pack statements, so none of them is
+# ever pushed out by another.
+STATEMENT_CACHE_SIZE = 256
+
+# Builds the parameterized INSERT statement for a table
+def insertSQL(table):
+	columns = TABLE_COLUMNS[table]
+	return "INSERT INTO %s(%s) VALUES(%s)" % (table, ", ".join(columns), ", ".join("?" * len(columns)))
+
+# Builds the INSERT ... ON CONFLICT DO UPDATE statement for a keyed table.
+# The WHERE clause skips the update when every column already holds the
+# same value, so unchanged rows are never rewritten.
+def upsertSQL(table):
+	columns = TABLE_COLUMNS[table]
+	key = TABLE_KEYS[table]
+	values = [column for column in columns if column not in key]
+	SQL = insertSQL(table) + " ON CONFLICT(%s) DO " % ", ".join(key)
+	if not values:
+		return SQL + "NOTHING"
+	return SQL + "UPDATE SET %s WHERE %s" % (
+		", ".join("%s = excluded.%s" % (column, column) for column in values),
+		" OR ".join("%s IS NOT excluded.%s" % (column, column) for column in values))
+
+# Returns the UPDATE statement that sets "columns" of the row of "table"
+# with a given key; its parameters are the new values, then the key.
+# There is one statement per (table, columns) pair a patch uses.
+@functools.lru_cache(maxsize=None)
+def updateSQL(table, columns):
+	return 'UPDATE "%s" SET %s WHERE %s' % (table, ", ".join("%s = ?" % column for column in columns),
+		" AND ".join("%s = ?" % column for column in TABLE_KEYS[table]))
+
+INSERT_STATEMENTS = {table: insertSQL(table) for table in TABLE_COLUMNS}
+UPSERT_STATEMENTS = {table: upsertSQL(table) for table in TABLE_COLUMNS}
+
+# The statements of a bulk deletion (see deletions.py), which stages the
+# IDs of the weapons to delete in a temporary table
+DELETION_STATEMENTS = {
+	"stage": "INSERT OR IGNORE INTO DeletedWeapon VALUES (?)",
+	"countEnchantments": "SELECT COUNT(*) FROM EnchantedWith WHERE ID IN (SELECT ID FROM DeletedWeapon)",
+	"delete": "DELETE FROM Weapon WHERE ID IN (SELECT ID FROM DeletedWeapon)",
+	"unusedMaterial": '''DELETE FROM Material WHERE Name = ? AND Type = ?
+		AND NOT EXISTS (SELECT 1 FROM Weapon WHERE Weapon.Material = Material.Name AND Weapon.Type = Material.Type)''',
+}
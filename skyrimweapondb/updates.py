@@ -0,0 +1,49 @@
+# UPDATES
+# All updates are from the Unofficial Skyrim Patch. Each one is a change
+# for the patch engine (see patches.py), which commits them in one
+# transaction and returns the rows before and after.
+from .patches import Change, applyPatch
+
+# The updates of the Unofficial Skyrim Patch, with the title each one is
+# printed under
+UNOFFICIAL_PATCH = [
+	("TWO-HANDED SWORD TYPE SPEED UPDATE", Change("Type", ("Two-Handed Sword",), {"Speed": 0.75})),
+	("EBONY ONE-HANDED AXE MATERIAL DAMAGE UPDATE", Change("Material", ("Ebony", "One-Handed Axe"), {"Damage": 14})),
+	("EBONY ONE-HANDED MACE MATERIAL DAMAGE UPDATE", Change("Material", ("Ebony", "One-Handed Mace"), {"Damage": 15})),
+]
+
+# Applies a list of (title, change) pairs as one patch, printing the row
+# of every change before and after under its title. Returns the diff.
+def applyTitledPatch(connect, patch):
+	diff = applyPatch(connect, [change for _, change in patch])
+	for (title, _), (change, before, after) in zip(patch, diff):
+		print("BEFORE " + title)
+		print(before)
+		print("AFTER UPDATE")
+		print(after)
+		print()
+	return diff
+
+# Fixes the two-handed speed to be 0.75
+def updateTwoHandedSwordSpeed(connect, update):
+	speed, name = update
+	return applyTitledPatch(connect, [("TWO-HANDED SWORD TYPE SPEED UPDATE",
+		Change("Type", (name,), {"Speed": speed}))])
+
+#Fixes the ebony war axe to be 14 damage
+def updateEbonyOneHandedAxe(connect, update):
+	damage, name, type = update
+	return applyTitledPatch(connect, [("EBONY ONE-HANDED AXE MATERIAL DAMAGE UPDATE",
+		Change("Material", (name, type), {"Damage": damage}))])
+
+#Fixes the ebony mace to be 15 damage
+def updateEbonyOneHandedMace(connect, update):
+	damage, name, type = update
+	return applyTitledPatch(connect, [("EBONY ONE-HANDED MACE MATERIAL DAMAGE UPDATE",
+		Change("Material", (name, type), {"Damage": damage}))])
+
+# Applies every update above in one transaction, printing each row before
+# and after. Returns the patch's diff.
+def applyUnofficialPatch(connect):
+	print("UPDATES BELOW")
+	return applyTitledPatch(connect, UNOFFICIAL_PATCH)
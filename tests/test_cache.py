@@ -0,0 +1,30 @@
+import unittest
+
+from skyrimweapondb.build import build
+from skyrimweapondb.connection import openConnection
+from skyrimweapondb.loader import createEnchantedWith
+from skyrimweapondb.packs import loadPack, unloadPack
+from skyrimweapondb.queries import selectEnchantedWeapons
+
+class CacheTests(unittest.TestCase):
+	def setUp(self):
+		self.connect = openConnection(":memory:")
+		self.connect.execute("PRAGMA foreign_keys = ON")
+		build(self.connect)
+		createEnchantedWith(self.connect, ("xx014fce", "Water"))
+
+	def tearDown(self):
+		self.connect.close()
+
+	def testUnloadingAPackDropsCascadedEnchantments(self):
+		self.assertIn(("xx014fce", "Water"), selectEnchantedWeapons(self.connect, display=False))
+		unloadPack(self.connect, "Dawnguard")
+		self.assertNotIn(("xx014fce", "Water"), selectEnchantedWeapons(self.connect, display=False))
+
+	def testReloadingAPackDropsCascadedEnchantments(self):
+		self.assertIn(("xx014fce", "Water"), selectEnchantedWeapons(self.connect, display=False))
+		loadPack(self.connect, "Dawnguard", {"Weapon": []})
+		self.assertNotIn(("xx014fce", "Water"), selectEnchantedWeapons(self.connect, display=False))
+
+if __name__ == "__main__":
+	unittest.main()
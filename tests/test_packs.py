@@ -0,0 +1,65 @@
+import unittest
+
+from skyrimweapondb.build import build
+from skyrimweapondb.connection import openConnection
+from skyrimweapondb.packs import listPacks, loadPack, unloadPack
+
+# A mod that re-lists a base game perk, exactly as the base game has it
+MOD = {
+	"Forgeability": [(2, "Steel Smithing")],
+	"Material": [("Runed Steel", "One-Handed Sword", 11, 9, 90, None, "Steel Smithing")],
+	"Weapon": [("xx900001", "Runed Steel Sword", "One-Handed Sword", "Runed Steel")],
+}
+
+class PackTests(unittest.TestCase):
+	def setUp(self):
+		self.connect = openConnection(":memory:")
+		self.connect.execute("PRAGMA foreign_keys = ON")
+		build(self.connect)
+
+	def tearDown(self):
+		self.connect.close()
+
+	def rows(self, table):
+		return self.connect.execute('SELECT * FROM "%s" ORDER BY 1, 2' % table).fetchall()
+
+	def testLoadUnloadRoundTrip(self):
+		before = {table: self.rows(table) for table in MOD}
+		loadPack(self.connect, "MyMod", MOD)
+		# The perk still belongs to the base game
+		self.assertEqual(listPacks(self.connect)["MyMod"], {"Material": 1, "Weapon": 1})
+		self.assertEqual(unloadPack(self.connect, "MyMod"), {"Weapon": 1, "Material": 1, "Forgeability": 0})
+		self.assertEqual({table: self.rows(table) for table in MOD}, before)
+		self.assertNotIn("MyMod", listPacks(self.connect))
+
+	def testPacksShareIdenticalRows(self):
+		loadPack(self.connect, "MyMod", MOD)
+		loadPack(self.connect, "OtherMod", {"Forgeability": [(2, "Steel Smithing")]})
+		with self.assertRaises(ValueError):
+			loadPack(self.connect, "OtherMod", {"Forgeability": [(3, "Steel Smithing")]})
+
+	def testRowsInUseOutsideThePackAreKept(self):
+		loadPack(self.connect, "MyMod", MOD)
+		loadPack(self.connect, "OtherMod", {
+			"Material": [MOD["Material"][0]],
+			"Weapon": [("xx900002", "Runed Steel Blade", "One-Handed Sword", "Runed Steel")],
+		})
+		self.assertEqual(unloadPack(self.connect, "MyMod"), {"Weapon": 1, "Material": 0, "Forgeability": 0})
+		self.assertEqual(unloadPack(self.connect, "OtherMod"), {"Weapon": 1, "Material": 0, "Forgeability": 0})
+		self.assertEqual(unloadPack(self.connect, "MyMod"), {"Weapon": 0, "Material": 1, "Forgeability": 0})
+
+	def testReloadRemovesRowsThePackDropped(self):
+		loadPack(self.connect, "MyMod", MOD)
+		counts = loadPack(self.connect, "MyMod", {"Material": MOD["Material"], "Weapon": []})
+		self.assertEqual(counts, {"Material": 0, "Weapon": 1})
+		self.assertEqual(listPacks(self.connect)["MyMod"], {"Material": 1})
+
+	def testMissingReferenceFailsWithoutWriting(self):
+		before = {table: self.rows(table) for table in MOD}
+		with self.assertRaises(ValueError):
+			loadPack(self.connect, "MyMod", {"Material": MOD["Material"],
+				"Weapon": [("xx900002", "Runed Axe", "One-Handed Axe", "Runed Steel")]})
+		self.assertEqual({table: self.rows(table) for table in MOD}, before)
+
+if __name__ == "__main__":
+	unittest.main()
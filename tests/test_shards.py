@@ -0,0 +1,61 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from skyrimweapondb.build import build
+from skyrimweapondb.connection import openConnection
+from skyrimweapondb.importer import SEED_ORDER
+from skyrimweapondb.packs import loadPackDirectory
+from skyrimweapondb.shards import buildSharded, defaultSources
+
+# A mod that re-lists a base game perk, exactly as the base game has it
+MOD_FILES = {
+	"Forgeability.csv": "Level,Perk_Name\n2,Steel Smithing\n",
+	"Material.csv": "Name,Type,Weight,Damage,Value,Speed,Forgeability\nRuned Steel,One-Handed Sword,11,9,90,,Steel Smithing\n",
+	"Weapon.csv": "ID,Name,Type,Material\nxx900001,Runed Steel Sword,One-Handed Sword,Runed Steel\n",
+}
+
+class ShardTests(unittest.TestCase):
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.writeMod(MOD_FILES)
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def writeMod(self, files):
+		os.makedirs(os.path.join(self.directory, "MyMod"), exist_ok=True)
+		for name, text in files.items():
+			with open(os.path.join(self.directory, "MyMod", name), "w") as file:
+				file.write(text)
+
+	def tables(self, connect):
+		return {table: sorted(connect.execute('SELECT * FROM "%s"' % table).fetchall(), key=repr) for table in SEED_ORDER}
+
+	def expected(self):
+		connect = openConnection(":memory:")
+		connect.execute("PRAGMA foreign_keys = ON")
+		build(connect)
+		loadPackDirectory(connect, os.path.join(self.directory, "MyMod"))
+		return self.tables(connect)
+
+	def buildSharded(self, processes):
+		connect = openConnection(":memory:")
+		buildSharded(connect, defaultSources() + [(os.path.join(self.directory, "MyMod"), "MyMod")], processes)
+		return connect
+
+	def testModReListingABaseRowInTheSameShard(self):
+		self.assertEqual(self.tables(self.buildSharded(1)), self.expected())
+
+	def testModReListingABaseRowInAnotherShard(self):
+		self.assertEqual(self.tables(self.buildSharded(4)), self.expected())
+
+	def testModChangingABaseRowFails(self):
+		self.writeMod({"Forgeability.csv": "Level,Perk_Name\n3,Steel Smithing\n"})
+		for processes in (1, 4):
+			with self.assertRaises(ValueError):
+				self.buildSharded(processes)
+
+if __name__ == "__main__":
+	unittest.main()